@@ -4,11 +4,140 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import glob
+import json
+import os
+
 import py
+import pytest
+
+from utils.animations import disable_animations
+from utils.cassette import Cassette
+from utils.command_log import CommandRecorder
+from utils.explicit_waits import use_explicit_waits
+from utils.headless import HeadlessMode
+from utils.http_cache import HTTPCache
+from utils.login_cache import LoginCache
+from utils.page_load import PAGE_LOAD_STRATEGIES, use_page_load_strategy
+from utils.resource_policy import RESOURCE_KINDS, ResourcePolicy
+from utils.session_pool import SessionPool
+from utils.wait_profile import WaitProfiler
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'roundtrip_budget(n): fail the test if it sends more than '
+        'n WebDriver commands.')
+    config.addinivalue_line(
+        'markers', 'fresh_session: run the test in a browser of its own when '
+        '--reusesessions is given.')
+    config.addinivalue_line(
+        'markers', 'shared_page: the nondestructive test only reads the pages it '
+        'opens, so with --reusesessions it may reuse a page an earlier test loaded.')
+    config.addinivalue_line(
+        'markers', 'uncached_login: always log in through the login pages, '
+        'even when --cachelogins is given.')
+    config.addinivalue_line(
+        'markers', 'static_page: the test only reads what the server sends, so '
+        'with --browserless it runs against the page html without a browser.')
+    config.addinivalue_line(
+        'markers', 'block_resources(*kinds): block these kinds of resources (%s) '
+        'for the test instead of the ones given with --blockresources.' % ', '.join(RESOURCE_KINDS))
+    config.addinivalue_line(
+        'markers', 'load_resources(*kinds): let the test load these kinds of resources '
+        'even when they are blocked.')
+    config._command_log = {}
+    if config.option.cache_logins:
+        config._login_cache = LoginCache()
+    if config.option.headless:
+        from pytest_mozwebqa.selenium_client import Client
+        config._headless = HeadlessMode()
+        config._headless.configure(config.option)
+        config._headless.install(Client)
+    if config.option.page_load_strategy != 'normal':
+        use_page_load_strategy(config.option.page_load_strategy)
+    blocked = [kind for kind in (config.option.blocked_resources or '').split(',') if kind]
+    if set(blocked).difference(RESOURCE_KINDS):
+        raise pytest.UsageError('--blockresources takes a comma separated list of %s' % ', '.join(RESOURCE_KINDS))
+    config._resource_policy = ResourcePolicy(config.option, blocked)
+    if config.option.reuse_sessions:
+        from pytest_mozwebqa.selenium_client import Client
+        config._session_pool = SessionPool()
+        config._session_pool.install(Client)
+    if config.option.wait_profile_path:
+        config._wait_profiler = WaitProfiler()
+        config._wait_profiler.install()
+    if config.option.http_cache_dir:
+        config._http_cache = HTTPCache(config.option.http_cache_dir,
+                                       config.option.http_cache_size * 1024 * 1024)
+    if config.option.record_path and config.option.replay_path:
+        raise pytest.UsageError('--record and --replay cannot be used together')
+    if config.option.record_path or config.option.replay_path:
+        config._cassette = Cassette(config.option.record_path or config.option.replay_path,
+                                    record=bool(config.option.record_path))
+        config._cassette.install()
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if config.option.reuse_sessions:
+        config._session_pool.close()
+    if config.option.headless:
+        config._headless.close()
+    if config.option.command_log_path and config._command_log:
+        with open(_worker_path(config, config.option.command_log_path), 'w') as f:
+            json.dump(config._command_log, f, indent=2, sort_keys=True)
+    if config.option.wait_profile_path and config._wait_profiler.waits:
+        config._wait_profiler.write(_worker_path(config, config.option.wait_profile_path))
+    if config.option.record_path:
+        if _is_xdist_master(config):
+            # the workers have recorded everything, gather their cassettes into one
+            Cassette.merge(config.option.record_path, _worker_paths(config.option.record_path))
+        else:
+            config._cassette.save(_worker_path(config, config.option.record_path))
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.option.browserless:
+        for item in items:
+            if 'static_page' in item.keywords:
+                item.keywords['skip_selenium'] = True
+
+
+def _is_xdist_master(config):
+    return not hasattr(config, 'slaveinput') and getattr(config.option, 'dist', 'no') != 'no'
+
+
+def _worker_paths(path):
+    root, extension = os.path.splitext(path)
+    return glob.glob('%s.gw*%s' % (root, extension))
+
+
+def _worker_path(config, path):
+    """Gives each xdist worker its own copy of a report file."""
+    if hasattr(config, 'slaveinput'):
+        root, extension = os.path.splitext(path)
+        return '%s.%s%s' % (root, config.slaveinput['slaveid'], extension)
+    return path
+
 
+@pytest.mark.tryfirst
 def pytest_runtest_setup(item):
     pytest_mozwebqa = py.test.config.pluginmanager.getplugin("mozwebqa")
     pytest_mozwebqa.TestSetup.api_base_url = item.config.option.api_base_url
+    # must be decided before pytest-mozwebqa starts the browser
+    blocked = item.config._resource_policy.blocked_for(item.keywords)
+    item.config._resource_policy.apply(item.config.option, blocked)
+    if item.config.option.reuse_sessions:
+        item.config._session_pool.fresh = 'fresh_session' in item.keywords
+        item.config._session_pool.keep_page = _is_shared_page_test(item)
+        item.config._session_pool.key = blocked
+    if item.config.option.wait_profile_path:
+        item.config._wait_profiler.test = item.nodeid
+
+
+def _is_shared_page_test(item):
+    return 'shared_page' in item.keywords and 'nondestructive' in item.keywords
 
 
 def pytest_addoption(parser):
@@ -18,8 +147,116 @@ def pytest_addoption(parser):
                      metavar='str',
                      default="https://addons-dev.allizom.org",
                      help="specify the api url")
+    parser.addoption("--zeroimplicitwait",
+                     action="store_true",
+                     dest='zero_implicit_wait',
+                     default=False,
+                     help="keep the implicit wait at 0 and make every wait explicit")
+    parser.addoption("--pageloadstrategy",
+                     action="store",
+                     dest='page_load_strategy',
+                     metavar='str',
+                     choices=PAGE_LOAD_STRATEGIES,
+                     default='normal',
+                     help="when navigation returns: normal, or eager, which waits for the page's readiness probe (default: %default)")
+    parser.addoption("--noanimations",
+                     action="store_true",
+                     dest='no_animations',
+                     default=False,
+                     help="turn off css transitions, css animations and jquery effects on every page")
+    parser.addoption("--headless",
+                     action="store_true",
+                     dest='headless',
+                     default=False,
+                     help="run the browser without a display, in a fixed size window and a lean profile")
+    parser.addoption("--blockresources",
+                     action="store",
+                     dest='blocked_resources',
+                     metavar='str',
+                     help="comma separated kinds of resources the browser does not load: %s" % ', '.join(RESOURCE_KINDS))
+    parser.addoption("--reusesessions",
+                     action="store_true",
+                     dest='reuse_sessions',
+                     default=False,
+                     help="reuse browser sessions between tests, resetting them in between")
+    parser.addoption("--cachelogins",
+                     action="store_true",
+                     dest='cache_logins',
+                     default=False,
+                     help="log each user in once per worker and reuse their session cookies")
+    parser.addoption("--browserless",
+                     action="store_true",
+                     dest='browserless',
+                     default=False,
+                     help="run tests marked static_page against the page html, without a browser")
+    parser.addoption("--commandlog",
+                     action="store",
+                     dest='command_log_path',
+                     metavar='path',
+                     help="record the WebDriver commands of each test to a json file")
+    parser.addoption("--waitprofile",
+                     action="store",
+                     dest='wait_profile_path',
+                     metavar='path',
+                     help="record the time spent in every wait to a .json or .csv file")
+    parser.addoption("--httpcache",
+                     action="store",
+                     dest='http_cache_dir',
+                     metavar='path',
+                     help="keep api and statistics responses in this directory and revalidate them")
+    parser.addoption("--httpcachesize",
+                     action="store",
+                     type='int',
+                     dest='http_cache_size',
+                     metavar='int',
+                     default=50,
+                     help="size in megabytes the http cache directory is trimmed to (default: %default)")
+    parser.addoption("--record",
+                     action="store",
+                     dest='record_path',
+                     metavar='path',
+                     help="record every http exchange made through requests to a cassette file")
+    parser.addoption("--replay",
+                     action="store",
+                     dest='replay_path',
+                     metavar='path',
+                     help="answer http requests made through requests from a recorded cassette file")
 
 
 def pytest_funcarg__mozwebqa(request):
     pytest_mozwebqa = py.test.config.pluginmanager.getplugin("mozwebqa")
-    return pytest_mozwebqa.TestSetup(request)
+    mozwebqa = pytest_mozwebqa.TestSetup(request)
+    if mozwebqa.selenium and request.config.option.reuse_sessions:
+        mozwebqa.shared_pages = _is_shared_page_test(request.node)
+    if mozwebqa.selenium and request.config.option.cache_logins and \
+            'uncached_login' not in request.keywords:
+        mozwebqa.login_cache = request.config._login_cache
+    if request.config.option.http_cache_dir:
+        mozwebqa.http_cache = request.config._http_cache
+    if request.config.option.record_path or request.config.option.replay_path:
+        mozwebqa.cassette = request.config._cassette
+    mozwebqa.page_load_strategy = request.config.option.page_load_strategy
+    if mozwebqa.selenium and request.config.option.no_animations:
+        disable_animations(mozwebqa.selenium)
+    if mozwebqa.selenium and request.config.option.zero_implicit_wait:
+        use_explicit_waits(mozwebqa.selenium, mozwebqa.default_implicit_wait)
+        mozwebqa.default_implicit_wait = 0
+    # installed last, so retries and scripts added by the wrappers above are not counted
+    if mozwebqa.selenium and (request.config.option.command_log_path or
+                              'roundtrip_budget' in request.keywords):
+        request.node.command_recorder = CommandRecorder()
+        request.node.command_recorder.install(mozwebqa.selenium)
+    return mozwebqa
+
+
+def pytest_runtest_makereport(__multicall__, item, call):
+    report = __multicall__.execute()
+    recorder = getattr(item, 'command_recorder', None)
+    if report.when == 'call' and recorder:
+        item.config._command_log[item.nodeid] = recorder.summary()
+        budget = item.keywords.get('roundtrip_budget')
+        if budget and report.passed and recorder.count > budget.args[0]:
+            report.outcome = 'failed'
+            report.longrepr = 'Round trip budget exceeded: %s WebDriver commands sent, budget is %s.' % (
+                recorder.count, budget.args[0])
+    return report
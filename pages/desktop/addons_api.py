@@ -4,39 +4,228 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+from __future__ import absolute_import
+
 import re
-import urllib2
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from threading import Lock
+from time import time
 
+import requests
 import xml.etree.ElementTree as ET
 
 
+def _remove_html_tags(text):
+    """removes all HTML tags from given string"""
+    return re.sub(r'<.*?>', '', text)
+
+
+class AddonRecord(object):
+    """
+    The fields of one <addon> element of a search response, decoded once.
+
+    Counts and ids are ints, HTML tags are stripped from the description
+    and developer comments, and compatible_applications (name, min version,
+    max version), authors and previews are tuples. Fields missing from the
+    response are None.
+    """
+
+    # field: (path below <addon>, attribute or None for the text, conversion)
+    sources = {
+        'name': ('name', None, None),
+        'type': ('type', None, None),
+        'type_id': ('type', 'id', int),
+        'status': ('status', None, None),
+        'status_id': ('status', 'id', int),
+        'install': ('install', None, None),
+        'daily_users': ('daily_users', None, int),
+        'total_downloads': ('total_downloads', None, int),
+        'reviews_count': ('reviews', 'num', int),
+        'rating': ('rating', None, None),
+        'homepage': ('homepage', None, None),
+        'support': ('support', None, None),
+        'learnmore': ('learnmore', None, None),
+        'icon': ('icon', None, None),
+        'summary': ('summary', None, None),
+        'description': ('description', None, _remove_html_tags),
+        'developer_comments': ('developer_comments', None, _remove_html_tags),
+        'compatible_applications': ('compatible_applications/application', None, None),
+        'authors': ('authors', None, None),
+        'previews': ('previews', None, None),
+    }
+
+    __slots__ = tuple(sources)
+
+    def __init__(self, addon=None):
+        for field, (relpath, attr, convert) in self.sources.items():
+            element = addon.find(relpath) if addon is not None else None
+            if element is None:
+                value = None
+            elif field == 'compatible_applications':
+                value = (element.findtext('name'),
+                         element.findtext('min_version'),
+                         element.findtext('max_version'))
+            elif field == 'authors':
+                value = tuple(author.findtext('name') for author in element)
+            elif field == 'previews':
+                value = tuple(preview.findtext('thumbnail').strip() for preview in element)
+            else:
+                value = element.get(attr) if attr else element.text
+                if value is not None and convert:
+                    value = convert(value)
+            setattr(self, field, value)
+
+
+class _ChunkReader(object):
+    """file like view of an iterator of byte chunks, for ET.iterparse."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def read(self, size=-1):
+        return next(self._chunks, b'')
+
+
+class _ResponseCache:
+    """thread safe least recently used cache whose entries expire after ttl seconds."""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            stored_at, value = self._entries.pop(key)
+            if time() - stored_at > self.ttl:
+                return None
+            self._entries[key] = (stored_at, value)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time(), value)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class AddonsAPI:
 
+    # one keep-alive connection pool for every request made during the run
+    http = requests.Session()
+    http.mount('http://', requests.adapters.HTTPAdapter(max_retries=3))
+    http.mount('https://', requests.adapters.HTTPAdapter(max_retries=3))
+
+    responses = _ResponseCache(max_size=100, ttl=300)
+
     def __init__(self, testsetup, search_query):
         """
         This class checks the XML response returned by
         the AddonsAPI on addons.mozilla.org.  The search_query
         parameter is the name of the add-on to search for.
+
+        Responses are cached for the run, so looking up the same
+        add-on again does not hit the server.
         """
         self.search_query = search_query
         self.api_url = '%s/en-us/firefox/api/1.5/search/%s' % (testsetup.base_url, search_query)
-        self.xml_response = ET.parse(urllib2.urlopen(self.api_url))
+        response = ET.fromstring(self._fetch(testsetup, search_query))
+        self.addon = AddonRecord(response.find('addon'))
+
+    def _fetch(self, testsetup, search_query):
+        """returns the body of the search response, from the cache when possible."""
+        key = (testsetup.base_url, search_query)
+        content = self.responses.get(key)
+        if content is None:
+            response = self._get(testsetup, self.api_url)
+            response.raise_for_status()
+            content = response.content
+            self.responses.put(key, content)
+        return content
+
+    @classmethod
+    def bulk(cls, testsetup, names, concurrency=8):
+        """
+        looks up every name with up to concurrency requests in flight
+        and yields (name, api, error) as each lookup completes, in no
+        particular order. error is None when the lookup succeeded and
+        api is None when it failed.
+        """
+        def lookup(name):
+            try:
+                return name, cls(testsetup, name), None
+            except Exception as error:
+                return name, None, error
+
+        pool = ThreadPool(concurrency)
+        try:
+            for result in pool.imap_unordered(lookup, names):
+                yield result
+        finally:
+            pool.terminate()
+
+    @classmethod
+    def iter_addons(cls, testsetup, search_query):
+        """
+        yields an AddonRecord for every add-on in the search response.
+
+        The response is parsed as it is downloaded and every add-on
+        is dropped from the tree once it has been read, so memory stays
+        flat however many add-ons the search returns.
+        """
+        api_url = '%s/en-us/firefox/api/1.5/search/%s' % (testsetup.base_url, search_query)
+        response = cls._get(testsetup, api_url, stream=True)
+        response.raise_for_status()
+        try:
+            depth = 0
+            root = None
+            for event, element in ET.iterparse(_ChunkReader(response.iter_content(16384)),
+                                               events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if root is None:
+                        root = element
+                    continue
+                depth -= 1
+                if depth == 1 and element.tag == 'addon':
+                    yield AddonRecord(element)
+                    root.clear()
+        finally:
+            response.close()
+
+    @classmethod
+    def _get(cls, testsetup, url, stream=False):
+        """
+        requests url over the shared session, revalidating against
+        the on-disk http cache when the run has one.
+        """
+        http_cache = getattr(testsetup, 'http_cache', None)
+        if http_cache:
+            return http_cache.get(url, session=cls.http, timeout=testsetup.timeout)
+        return cls.http.get(url, timeout=testsetup.timeout, stream=stream)
 
     def get_addon_name(self):
         """
         returns the value of the name element
         of the first add-on from the xml response.
         """
-        name = self._parse_response('name')
-        return name.lower()
+        return self._field('name').lower()
 
     def get_addon_type(self):
         """
         returns the value of the type element
         of the first add-on from the xml response.
         """
-        addon_type = self._parse_response(relpath='type')
-        return addon_type.lower()
+        return self._field('type').lower()
 
     def get_addon_type_id(self):
         """
@@ -44,56 +233,49 @@ class AddonsAPI:
         element of the the first add-on from
         the xml response.
         """
-        addon_type = self._parse_response(relpath='type', attr='id')
-        return int(addon_type)
+        return self._field('type_id')
 
     def get_install_link(self):
         """
         returns the url value of the link element
         of the first add-on from the xml response.
         """
-        link = self._parse_response(relpath='install')
-        return link.lower()
+        return self._field('install').lower()
 
     def get_daily_users(self):
         """
         returns the value of the daily_users element
         of the first add-on from the xml response
         """
-        daily_users = self._parse_response(relpath='daily_users')
-        return int(daily_users)
+        return self._field('daily_users')
 
     def get_addon_status_id(self):
         """
         returns the id attribute of the status element
         of the first add-on from the xml response.
         """
-        status_id = self._parse_response(relpath='status', attr='id')
-        return int(status_id)
+        return self._field('status_id')
 
     def get_addon_status(self):
         """
         returns the status element
         of the first add-on from the xml response.
         """
-        status = self._parse_response(relpath='status')
-        return status.lower()
+        return self._field('status').lower()
 
     def get_reviews_count(self):
         """
         returns the num attribute of reviews element
         of the first add-on from the xml response.
         """
-        count = self._parse_response(relpath='reviews', attr='num')
-        return int(count)
+        return self._field('reviews_count')
 
     def get_home_page(self):
         """
         returns text of the homepage element
         of the first add-on from the xml response.
         """
-        homepage = self._parse_response(relpath='homepage')
-        return homepage.lower()
+        return self._field('homepage').lower()
 
     def get_devs_comments(self):
         """
@@ -101,57 +283,53 @@ class AddonsAPI:
         of the first add-on from the xml response.
         all HTML tags are stripped.
         """
-        devs_comments = self._parse_response(relpath='developer_comments')
-        return self._remove_html_tags(devs_comments)
+        return self._field('developer_comments')
 
     def get_learn_more_url(self):
         """
         returns text of the learnmore element
         of the first add-on from the xml response.
         """
-        return self._parse_response(relpath='learnmore')
+        return self._field('learnmore')
 
     def get_total_downloads(self):
         """
         returns the total_downloads element
         of the first add-on from the xml response.
         """
-        downloads = self._parse_response(relpath='total_downloads')
-        return int(downloads)
+        return self._field('total_downloads')
 
     def get_compatible_applications(self):
         """
         returns name, min version and max version of
         compatible application of the first add-on from the xml response.
         """
-        xpath = 'compatible_applications/application/'
-        name_path = xpath + 'name'
-        min_ver_path = xpath + 'min_version'
-        max_ver_path = xpath + 'max_version'
-
-        return map(self._parse_response,
-                   [name_path, min_ver_path, max_ver_path])
+        application = self._field('compatible_applications')
+        for relpath, value in zip(['name', 'min_version', 'max_version'], application):
+            if value is None:
+                raise ET.ParseError(self._error_message('compatible_applications/application/' + relpath))
+        return list(application)
 
     def get_rating(self):
         """
         returns text of the rating element
         of the first add-on from the xml response.
         """
-        return self._parse_response(relpath='rating')
+        return self._field('rating')
 
     def get_support_url(self):
         """
         returns text of the support element
         of the first add-on from the xml response.
         """
-        return self._parse_response(relpath='support')
+        return self._field('support')
 
     def get_icon_url(self):
         """
         returns text of the first icon element
         of the first add-on from the xml response.
         """
-        return self._parse_response(relpath='icon')
+        return self._field('icon')
 
     def get_addon_description(self):
         """
@@ -159,60 +337,39 @@ class AddonsAPI:
         of the first add-on from the xml response.
         all HTML tags are stripped.
         """
-        desc = self._parse_response(relpath='description')
-        return self._remove_html_tags(desc)
+        return self._field('description')
 
     def get_addon_summary(self):
         """
         returns text of the summary element
         of the first add-on from the xml response.
         """
-        return self._parse_response(relpath='summary')
+        return self._field('summary')
 
     def get_list_of_addon_author_names(self):
         """
         returns list of author names of the first add-on
         from the xml response
         """
-        authors_el = self._get_element(relpath='authors')
-        authors_list = []
-        for child in authors_el:
-            authors_list.append(child.find('name').text)
-        return authors_list
+        return list(self._field('authors'))
 
     def get_list_of_addon_images_links(self):
         """
         returns list of thumbnail image links
         of the first add-on from xml response
         """
-        preview_el = self._get_element(relpath='previews')
-        link_list = []
-        for child in preview_el:
-            link = child.find('thumbnail').text
-            link_list.append(link.strip())
-        return link_list
+        return list(self._field('previews'))
 
-    def _parse_response(self, relpath, attr=None):
+    def _field(self, field):
         """
-        returns text node of element or attribute of element
-        of the first add-on from xml response.
+        returns the decoded field of the first add-on
+        from xml response.
         """
-        try:
-            el = self.xml_response.getroot().find('./addon/%s' % relpath)
-            return attr and el.attrib[attr] or el.text
-        except (AttributeError, KeyError):
+        value = getattr(self.addon, field)
+        if value is None:
+            relpath, attr, convert = AddonRecord.sources[field]
             raise ET.ParseError(self._error_message(relpath, attr))
-
-    def _get_element(self, relpath):
-        """returns element of the first add-on from xml response."""
-        try:
-            return self.xml_response.getroot().find('./addon/%s' % relpath)
-        except AttributeError:
-            raise ET.ParseError(self._error_message(relpath))
-
-    def _remove_html_tags(self, text):
-        """removes all HTML tags from given string"""
-        return re.sub(r'<.*?>', '', text)
+        return value
 
     def _error_message(self, relpath, attr=None):
         """generates error message text"""
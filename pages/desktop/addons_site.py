@@ -43,6 +43,15 @@ class ViewReviews(Base):
 
     _review_locator = (By.CSS_SELECTOR, 'div.review:not(.reply)')
 
+    # what ListingCrawler reads from each review
+    _listing_item_locator = _review_locator
+    _listing_fields = {
+        'text': ((By.CSS_SELECTOR, '.description'), 'text'),
+        'rating': ((By.CSS_SELECTOR, 'span.stars'), 'text'),
+        'author': ((By.CSS_SELECTOR, 'a:not(.permalink)'), 'text'),
+        'date': ((By.CSS_SELECTOR, '.byline'), 'text'),
+    }
+
     @property
     def reviews(self):
         """Returns review object with index."""
@@ -51,7 +60,7 @@ class ViewReviews(Base):
     @property
     def paginator(self):
         from pages.desktop.regions.paginator import Paginator
-        return Paginator(self.testsetup)
+        return Paginator(self.testsetup, self)
 
     class ReviewSnippet(Base):
 
@@ -25,6 +25,15 @@ class Base(Page):
     def login(self, method="normal", user="default"):
         from pages.desktop.user import Login
 
+        login_cache = getattr(self.testsetup, 'login_cache', None)
+        if login_cache and login_cache.restore(self.selenium, user):
+            if self.header.is_user_logged_in:
+                return
+            # the server no longer knows the cached session
+            login_cache.invalidate(user)
+            self.selenium.delete_all_cookies()
+            self.selenium.refresh()
+
         if method == "normal":
             login = self.header.click_login_normal()
             login.login_user_normal(user)
@@ -39,6 +48,10 @@ class Base(Page):
                 login = self.header.click_login_normal()
                 login.login_user_normal(user)
 
+        if login_cache:
+            WebDriverWait(self.selenium, self.timeout).until(lambda s: self.header.is_user_logged_in)
+            login_cache.store(user, self.selenium.get_cookies())
+
     @property
     def page_title(self):
         WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
@@ -235,6 +248,9 @@ class Base(Page):
             return self.is_element_visible(*self._register_locator)
 
         def click_logout(self):
+            login_cache = getattr(self.testsetup, 'login_cache', None)
+            if login_cache:
+                login_cache.invalidate_session(self.selenium.get_cookies())
             hover_element = self.selenium.find_element(*self._account_controller_locator)
             click_element = self.selenium.find_element(*self._logout_locator)
             ActionChains(self.selenium).move_to_element(hover_element).\
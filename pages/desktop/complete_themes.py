@@ -28,6 +28,16 @@ class CompleteThemes(Base):
     _last_page_link_locator = (By.CSS_SELECTOR, '.rel > a:nth-child(4)')
     _explore_filter_links_locators = (By.CSS_SELECTOR, '#side-explore a')
 
+    # what ListingCrawler reads from each complete theme
+    _listing_item_locator = _addons_root_locator
+    _listing_fields = {
+        'name': (_addon_name_locator, 'text'),
+        'url': ((By.CSS_SELECTOR, 'a'), 'href'),
+        'date': (_addons_metadata_locator, 'text'),
+        'downloads': (_addons_download_locator, 'text'),
+        'rating': (_addons_rating_locator, 'text'),
+    }
+
     @property
     def _addons_root_element(self):
         return self.selenium.find_element(*self._addons_root_locator)
@@ -113,7 +123,7 @@ class CompleteThemes(Base):
     @property
     def paginator(self):
         from pages.desktop.regions.paginator import Paginator
-        return Paginator(self.testsetup)
+        return Paginator(self.testsetup, self)
 
     class CompleteTheme(Page):
 
@@ -156,6 +166,10 @@ class CompleteThemes(Base):
         def is_incompatible_flag_visible(self):
             # This refers to the grey 'This complete theme is incompatible' text on the panel
 
+            if not self._has_implicit_wait:
+                elements = self._root_element.find_elements(*self._is_incompatible_locator)
+                return len(elements) > 0 and elements[0].is_displayed()
+
             from selenium.common.exceptions import NoSuchElementException
             self.selenium.implicitly_wait(0)
             try:
@@ -21,6 +21,7 @@ class Details(Base):
 
     # addon informations
     _title_locator = (By.CSS_SELECTOR, 'hgroup .addon')
+    _ready_locator = _title_locator
     _version_number_locator = (By.CSS_SELECTOR, "span.version-number")
     _no_restart_locator = (By.CSS_SELECTOR, "span.no-restart")
     _authors_locator = (By.XPATH, "//h4[@class='author']/a")
@@ -92,6 +93,25 @@ class Details(Base):
     _contribute_button_locator = (By.ID, 'contribute-button')
     _paypal_login_dialog_locator = (By.CSS_SELECTOR, '#page .content')
 
+    # values read in one round trip by snapshot()
+    _snapshot_fields = {
+        'title': (_title_locator, 'text'),
+        'breadcrumb': (_breadcrumb_locator, 'text'),
+        'version_number': (_version_number_locator, 'text'),
+        'no_restart': (_no_restart_locator, 'text'),
+        'authors': (_authors_locator, 'text', True),
+        'summary': (_summary_locator, 'text'),
+        'rating': (_rating_locator, 'text'),
+        'license_site': (_license_link_locator, 'href'),
+        'license_link_text': (_license_link_locator, 'text'),
+        'description': (_description_locator, 'text'),
+        'about_addon': (_about_addon_locator, 'text'),
+        'version_information_heading': (_version_information_heading_locator, 'text'),
+        'review_title': (_reviews_title_locator, 'text'),
+        'daily_users': (_daily_users_link_locator, 'text'),
+        'total_reviews': (_review_link_locator, 'text'),
+    }
+
     def __init__(self, testsetup, addon_name=None):
         #formats name for url
         Base.__init__(self, testsetup)
@@ -99,7 +119,11 @@ class Details(Base):
             self.addon_name = addon_name.replace(" ", "-")
             self.addon_name = re.sub(r'[^A-Za-z0-9\-]', '', self.addon_name).lower()
             self.addon_name = self.addon_name[:27]
-            self.selenium.get("%s/addon/%s" % (self.base_url, self.addon_name))
+            if self.selenium is None:
+                # skip_selenium tests read the static add-on information from the html
+                self.static_snapshot("%s/addon/%s" % (self.base_url, self.addon_name), self._snapshot_fields)
+                return
+            self.get_url("%s/addon/%s" % (self.base_url, self.addon_name))
         WebDriverWait(self.selenium, self.timeout).until(
             lambda s: self.is_element_visible(*self._title_locator))
 
@@ -107,17 +131,23 @@ class Details(Base):
     def _page_title(self):
         return "%s :: Add-ons for Firefox" % self.title
 
+    def snapshot(self, fields=None):
+        """Reads the static add-on information in one round trip, see Page.snapshot."""
+        return Page.snapshot(self, fields or self._snapshot_fields)
+
     @property
     def title(self):
-        base = self.selenium.find_element(*self._title_locator).text
+        base = self._read('title', self._title_locator)
         '''base = "firebug 1.8.9" we will have to remove version number for it'''
-        if "Themes" in self.selenium.find_element(*self._breadcrumb_locator).text:
+        if "Themes" in self.breadcrumb:
             return base
         else:
             return base.replace(self.version_number, '').replace(self.no_restart, '').strip()
 
     @property
     def no_restart(self):
+        if 'no_restart' in self._snapshot:
+            return self._snapshot['no_restart'] or ""
         if self.is_element_present(*self._no_restart_locator):
             return self.selenium.find_element(*self._no_restart_locator).text
         else:
@@ -139,7 +169,7 @@ class Details(Base):
 
     @property
     def total_reviews_count(self):
-        text = self.selenium.find_element(*self._review_link_locator).text
+        text = self._read('total_reviews', self._review_link_locator)
         return int(text.split()[0].replace(',', ''))
 
     def click_view_statistics(self):
@@ -151,16 +181,16 @@ class Details(Base):
 
     @property
     def daily_users_number(self):
-        text = self.selenium.find_element(*self._daily_users_link_locator).text
+        text = self._read('daily_users', self._daily_users_link_locator)
         return int(text.split()[0].replace(',', ''))
 
     @property
     def breadcrumb(self):
-        return self.selenium.find_element(*self._breadcrumb_locator).text
+        return self._read('breadcrumb', self._breadcrumb_locator)
 
     @property
     def version_number(self):
-        return self.selenium.find_element(*self._version_number_locator).text
+        return self._read('version_number', self._version_number_locator)
 
     @property
     def source_code_license_information(self):
@@ -168,15 +198,17 @@ class Details(Base):
 
     @property
     def authors(self):
+        if 'authors' in self._snapshot:
+            return self._snapshot['authors']
         return [element.text for element in self.selenium.find_elements(*self._authors_locator)]
 
     @property
     def summary(self):
-        return self.selenium.find_element(*self._summary_locator).text
+        return self._read('summary', self._summary_locator)
 
     @property
     def rating(self):
-        return re.findall("\d", self.selenium.find_element(*self._rating_locator).text)[0]
+        return re.findall("\d", self._read('rating', self._rating_locator))[0]
 
     def click_whats_this_license(self):
         self.selenium.find_element(*self._whats_this_license_locator).click()
@@ -185,15 +217,15 @@ class Details(Base):
 
     @property
     def license_site(self):
-        return self.selenium.find_element(*self._license_link_locator).get_attribute('href')
+        return self._read('license_site', self._license_link_locator, 'href')
 
     @property
     def license_link_text(self):
-        return self.selenium.find_element(*self._license_link_locator).text
+        return self._read('license_link_text', self._license_link_locator)
 
     @property
     def description(self):
-        return self.selenium.find_element(*self._description_locator).text
+        return self._read('description', self._description_locator)
 
     @property
     def other_apps(self):
@@ -201,7 +233,7 @@ class Details(Base):
 
     @property
     def version_information_heading(self):
-        return self.selenium.find_element(*self._version_information_heading_locator).text
+        return self._read('version_information_heading', self._version_information_heading_locator)
 
     @property
     def version_information_href(self):
@@ -213,11 +245,11 @@ class Details(Base):
 
     @property
     def about_addon(self):
-        return self.selenium.find_element(*self._about_addon_locator).text
+        return self._read('about_addon', self._about_addon_locator)
 
     @property
     def review_title(self):
-        return self.selenium.find_element(*self._reviews_title_locator).text
+        return self._read('review_title', self._reviews_title_locator)
 
     @property
     def review_details(self):
@@ -466,6 +498,7 @@ class Details(Base):
         WebDriverWait(self.selenium, self.timeout).until(lambda s: (self.selenium.execute_script('return window.pageYOffset')) > 1000)
 
     def expand_version_information(self):
+        self.discard_snapshot()
         self.selenium.find_element(*self._version_information_button_locator).click()
         WebDriverWait(self.selenium, self.timeout).until(
             lambda s: self.is_version_information_section_expanded)
@@ -475,6 +508,7 @@ class Details(Base):
         return self.is_element_visible(*self._version_information_content_locator)
 
     def expand_devs_comments(self):
+        self.discard_snapshot()
         self.selenium.find_element(*self._devs_comments_toggle_locator).click()
         WebDriverWait(self.selenium, self.timeout).until(
             lambda s: self.is_devs_comments_section_expanded)
@@ -522,6 +556,7 @@ class Details(Base):
         return self.selenium.find_element(*self._development_channel_title_locator).text
 
     def click_development_channel(self):
+        self.discard_snapshot()
         expander = self.selenium.find_element(*self._development_channel_toggle)
         expander_saved_class = expander.get_attribute('class')
         self.selenium.find_element(*self._development_channel_toggle).click()
@@ -5,7 +5,6 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
 from pages.desktop.base import Base
@@ -14,6 +13,7 @@ from pages.desktop.base import Base
 class DiscoveryPane(Base):
 
     _promo_box_locator = (By.ID, 'promos')
+    _ready_locator = _promo_box_locator
     _what_are_addons_text_locator = (By.CSS_SELECTOR, '#intro p')
     _mission_section_text_locator = (By.CSS_SELECTOR, '#mission > p')
     _learn_more_locator = (By.ID, 'learn-more')
@@ -37,11 +37,14 @@ class DiscoveryPane(Base):
 
     def __init__(self, testsetup, path):
         Base.__init__(self, testsetup)
-        self.selenium.get(self.base_url + path)
+        self.get_url(self.base_url + path)
         self.selenium.maximize_window()
         #resizing this page for elements that disappear when the window is < 1000
         #self.selenium.set_window_size(1000, 1000) Commented because this selenium call is still in beta
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.find_element(*self._promo_box_locator).size['height'] == 273)
+        self.wait_for_condition(
+            'var promos = document.getElementById(arguments[0]);'
+            'return promos !== null && Math.round(promos.getBoundingClientRect().height) == 273;',
+            [self._promo_box_locator[1]], 'Timeout waiting for the promo box to load.')
 
     @property
     def what_are_addons_text(self):
@@ -98,6 +101,9 @@ class DiscoveryPane(Base):
         return len(self.selenium.find_elements(*self._up_and_coming_item))
 
     def click_logout(self):
+        login_cache = getattr(self.testsetup, 'login_cache', None)
+        if login_cache:
+            login_cache.invalidate_session(self.selenium.get_cookies())
         self.selenium.find_element(*self._logout_link_locator).click()
         from pages.desktop.home import Home
         return Home(self.testsetup, open_url=False)
@@ -117,6 +123,10 @@ class DiscoveryPane(Base):
 
         _heading_locator = (By.CSS_SELECTOR, 'h2')
 
+        # the panels slide inside an overflow hidden box, so the heading is
+        # shown once it is inside every clipping ancestor
+        _is_shown_script = Page._dom_functions + "return isShown(arguments[0]);"
+
         def __init__(self, testsetup, element):
             Page.__init__(self, testsetup)
             self._root_element = element
@@ -130,8 +140,8 @@ class DiscoveryPane(Base):
             return self._root_element.is_displayed()
 
         def wait_for_next_promo(self):
-            WebDriverWait(self.selenium, self.timeout).until(lambda s:
-                                                         self._root_element.find_element(*self._heading_locator).is_displayed())
+            heading = self._root_element.find_element(*self._heading_locator)
+            self.wait_for_condition(self._is_shown_script, [heading], 'Timeout waiting for the next promo.')
 
 
 class DiscoveryThemesDetail(Base):
@@ -10,6 +10,7 @@ from selenium.webdriver.common.by import By
 
 from pages.page import Page
 from pages.desktop.base import Base
+from pages.desktop.search import SearchResultList, search_result
 
 
 class ExtensionsHome(Base):
@@ -21,6 +22,11 @@ class ExtensionsHome(Base):
     _featured_extensions_header_locator = (By.CSS_SELECTOR, "#page > .primary > h1")
     _paginator_locator = (By.CSS_SELECTOR, ".paginator.c.pjax-trigger")
 
+    # extensions are listed like search results
+    _listing_item_locator = _extensions_locator
+    _listing_fields = SearchResultList._listing_fields
+    _listing_record = staticmethod(search_result)
+
     @property
     def extensions(self):
         return [Extension(self.testsetup, web_element)
@@ -42,7 +48,7 @@ class ExtensionsHome(Base):
     @property
     def paginator(self):
         from pages.desktop.regions.paginator import Paginator
-        return Paginator(self.testsetup)
+        return Paginator(self.testsetup, self)
 
     @property
     def is_paginator_present(self):
@@ -6,7 +6,6 @@
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
 from pages.desktop.base import Base
@@ -41,6 +40,7 @@ class Home(Base):
     _extensions_menu_link = (By.CSS_SELECTOR, "#extensions > a")
 
     _promo_box_locator = (By.ID, "promos")
+    _ready_locator = _promo_box_locator
 
     _up_and_coming_locator = (By.ID, "upandcoming")
 
@@ -48,8 +48,11 @@ class Home(Base):
         """Creates a new instance of the class and gets the page ready for testing."""
         Base.__init__(self, testsetup)
         if open_url:
-            self.selenium.get(self.base_url)
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: s.find_element(*self._promo_box_locator).size['height'] == 271)
+            self.get_url(self.base_url)
+        self.wait_for_condition(
+            'var promos = document.getElementById(arguments[0]);'
+            'return promos !== null && Math.round(promos.getBoundingClientRect().height) == 271;',
+            [self._promo_box_locator[1]], 'Timeout waiting for the promo box to load.')
 
     def hover_over_addons_home_title(self):
         home_item = self.selenium.find_element(*self._amo_logo_link_locator)
@@ -4,13 +4,32 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+from urlparse import urlsplit, urlunsplit
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
 
 
+def page_url(listing_url, number):
+    """Returns the url of page number of a listing, keeping its other parameters."""
+    scheme, netloc, path, query, fragment = urlsplit(listing_url)
+    # only the page pair is rewritten, the others are kept as they were encoded
+    query = [pair for pair in query.split('&') if pair and pair.split('=')[0] != 'page']
+    query.append('page=%d' % number)
+    return urlunsplit((scheme, netloc, path, '&'.join(query), fragment))
+
+
 class Paginator(Page):
+    """
+    The paginator of a listing.
+
+    Besides clicking through the listing it can jump straight to a page
+    by loading the listing url with another page= parameter. After a jump
+    every number the paginator shows is read in one round trip. Pass the
+    listing page object as listing to have its snapshot discarded whenever
+    the paginator moves to another page.
+    """
 
     #Numbering
     _page_number_locator = (By.CSS_SELECTOR, 'nav.paginator .num > a:nth-child(1)')
@@ -28,26 +47,83 @@ class Paginator(Page):
     _total_item_number = (By.CSS_SELECTOR, 'nav.paginator .pos b:nth-child(3)')
 
     _updating_locator = (By.CSS_SELECTOR, "div.updating")
-
-    def _wait_for_results_refresh(self):
-        # On pages that do not have ajax refresh this wait will have no effect.
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._updating_locator))
+    _results_locator = (By.CSS_SELECTOR, ".items")
+
+    _ready_locator = (By.CSS_SELECTOR, 'nav.paginator')
+
+    _snapshot_fields = {
+        'page_number': (_page_number_locator, 'text'),
+        'total_page_number': (_total_page_number_locator, 'text'),
+        'start_item': (_start_item_number_locator, 'text'),
+        'end_item': (_end_item_number_locator, 'text'),
+        'total_items': (_total_item_number, 'text'),
+    }
+
+    def __init__(self, testsetup, listing=None):
+        Page.__init__(self, testsetup)
+        self._listing = listing
+        self._listing_url = None
+
+    def _moved(self):
+        self.discard_snapshot()
+        if self._listing is not None:
+            self._listing.discard_snapshot()
+
+    def _click_and_wait_for_results_refresh(self, locator):
+        # On pages that do not have ajax refresh the click loads a new page, which ends the wait.
+        self._moved()
+        generation = self.track_ajax(self._results_locator)
+        self.selenium.find_element(*locator).click()
+        self.wait_for_ajax_refresh(generation, self._results_locator, self._updating_locator)
 
     @property
     def page_number(self):
-        return int(self.selenium.find_element(*self._page_number_locator).text)
+        return int(self._read('page_number', self._page_number_locator))
 
     @property
     def total_page_number(self):
-        return int(self.selenium.find_element(*self._total_page_number_locator).text)
+        return int(self._read('total_page_number', self._total_page_number_locator))
+
+    def page_url(self, number):
+        """Returns the url of page number of the listing, keeping its other parameters."""
+        if self._listing_url is None:
+            self._listing_url = self.selenium.current_url
+        return page_url(self._listing_url, number)
+
+    def go_to_page(self, number):
+        self._moved()
+        self.get_url(self.page_url(number))
+        self.snapshot(self._snapshot_fields)
+
+    def go_to_last_page(self):
+        self.go_to_page(self.total_page_number)
+
+    def pages(self, start=None):
+        """
+        Loads every page of the listing from start on, yielding its number.
+
+        Without start the pages following the current one are loaded, and
+        the current one is yielded first. The total number of pages is read
+        once, on the first page. A listing that fits on one page has no
+        paginator and counts as page 1 of 1.
+        """
+        if start is None:
+            self._moved()
+            self.snapshot(self._snapshot_fields)
+            start = int(self._snapshot['page_number'] or 1)
+        else:
+            self.go_to_page(start)
+        total_page_number = int(self._snapshot['total_page_number'] or 1)
+        yield start
+        for number in range(start + 1, total_page_number + 1):
+            self.go_to_page(number)
+            yield number
 
     def click_first_page(self):
-        self.selenium.find_element(*self._first_page_locator).click()
-        self._wait_for_results_refresh()
+        self._click_and_wait_for_results_refresh(self._first_page_locator)
 
     def click_prev_page(self):
-        self.selenium.find_element(*self._prev_locator).click()
-        self._wait_for_results_refresh()
+        self._click_and_wait_for_results_refresh(self._prev_locator)
 
     @property
     def is_prev_page_disabled(self):
@@ -58,16 +134,14 @@ class Paginator(Page):
         return 'disabled' in self.selenium.find_element(*self._first_page_locator).get_attribute('class')
 
     def click_next_page(self):
-        self.selenium.find_element(*self._next_locator).click()
-        self._wait_for_results_refresh()
+        self._click_and_wait_for_results_refresh(self._next_locator)
 
     @property
     def is_next_page_disabled(self):
         return 'disabled' in self.selenium.find_element(*self._next_locator).get_attribute('class')
 
     def click_last_page(self):
-        self.selenium.find_element(*self._last_page_locator).click()
-        self._wait_for_results_refresh()
+        self._click_and_wait_for_results_refresh(self._last_page_locator)
 
     @property
     def is_last_page_disabled(self):
@@ -75,12 +149,12 @@ class Paginator(Page):
 
     @property
     def start_item(self):
-        return int(self.selenium.find_element(*self._start_item_number_locator).text)
+        return int(self._read('start_item', self._start_item_number_locator))
 
     @property
     def end_item(self):
-        return int(self.selenium.find_element(*self._end_item_number_locator).text)
+        return int(self._read('end_item', self._end_item_number_locator))
 
     @property
     def total_items(self):
-        return int(self.selenium.find_element(*self._total_item_number).text)
+        return int(self._read('total_items', self._total_item_number))
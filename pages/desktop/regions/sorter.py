@@ -6,7 +6,6 @@
 
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
 from pages.page import Page
@@ -28,6 +27,7 @@ class Sorter(Page):
 
     _hover_more_locator = (By.CSS_SELECTOR, "li.extras > a")
     _updating_locator = (By.CSS_SELECTOR, '.updating.tall')
+    _results_locator = (By.CSS_SELECTOR, '.items')
     _footer_locator = (By.ID, 'footer')
 
     def sort_by(self, type):
@@ -37,6 +37,7 @@ class Sorter(Page):
         footer_element = self.selenium.find_element(*self._footer_locator)
         ActionChains(self.selenium).move_to_element(footer_element).perform()
         click_element = self.selenium.find_element(*getattr(self, '_sort_by_%s_locator' % type.replace(' ', '_').lower()))
+        generation = self.track_ajax(self._results_locator)
         if type.replace(' ', '_').lower() in ["featured", "most_users", "top_rated", "newest"]:
             click_element.click()
         else:
@@ -44,7 +45,7 @@ class Sorter(Page):
             ActionChains(self.selenium).move_to_element(hover_element).\
                 move_to_element(click_element).\
                 click().perform()
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._updating_locator))
+        self.wait_for_ajax_refresh(generation, self._results_locator, self._updating_locator)
 
     @property
     def sorted_by(self):
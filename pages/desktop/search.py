@@ -5,6 +5,7 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 
+from collections import namedtuple
 from time import strptime, mktime
 
 from selenium.webdriver.common.by import By
@@ -14,6 +15,32 @@ from pages.page import Page
 from pages.desktop.base import Base
 
 
+SearchResult = namedtuple('SearchResult', [
+    'name', 'url', 'text', 'downloads', 'users', 'created_date', 'updated_date', 'is_compatible'])
+
+
+def _count(text):
+    if not text:
+        return None
+    return int(text.split()[0].replace(',', ''))
+
+
+def _date(text, prefix):
+    """Returns the date in POSIX format, or None when it is not one."""
+    try:
+        return mktime(strptime(text.strip().replace(prefix, ''), '%B %d, %Y'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def search_result(name, url, text, date, sort_criteria, class_name):
+    """Builds a SearchResult from the text and attributes of a result."""
+    return SearchResult(name=name, url=url, text=text,
+                        downloads=_count(sort_criteria), users=_count(sort_criteria),
+                        created_date=_date(date, 'Added '), updated_date=_date(date, 'Updated '),
+                        is_compatible='incompatible' not in (class_name or ''))
+
+
 class SearchResultList(Base):
 
     _number_of_results_found = (By.CSS_SELECTOR, "#search-facets > p")
@@ -24,6 +51,9 @@ class SearchResultList(Base):
 
     def __init__(self, testsetup):
         Base.__init__(self, testsetup)
+        if getattr(testsetup, 'page_load_strategy', 'normal') != 'normal':
+            # the search form navigates here, so get_url has not waited for the probe
+            self.wait_until_ready()
         try:  # the result could legitimately be zero, but give it time to make sure
             WebDriverWait(self.selenium, self.timeout).until(
                 lambda s: len(s.find_elements(*self._results_locator)) > 0
@@ -31,6 +61,11 @@ class SearchResultList(Base):
         except Exception:
             pass
 
+    @property
+    def _ready_locator(self):
+        # a result or the no results message, whichever the search found
+        return (By.CSS_SELECTOR, '%s, %s' % (self._results_locator[1], self._no_results_locator[1]))
+
     @property
     def is_no_results_present(self):
         return self.is_element_present(*self._no_results_locator)
@@ -45,6 +80,8 @@ class SearchResultList(Base):
 
     @property
     def filter(self):
+        # filtering replaces the results
+        self.discard_snapshot()
         from pages.desktop.regions.search_filter import FilterBase
         return FilterBase(self.testsetup)
 
@@ -53,6 +90,7 @@ class SearchResultList(Base):
         return len(self.selenium.find_elements(*self._results_locator))
 
     def click_sort_by(self, type):
+        self.discard_snapshot()
         from pages.desktop.regions.sorter import Sorter
         Sorter(self.testsetup).sort_by(type)
 
@@ -77,10 +115,25 @@ class SearchResultList(Base):
                 for web_element in elements
                 ]
 
+    @property
+    def result_records(self):
+        """
+        Reads every result into an immutable SearchResult with one round trip.
+
+        Counts are ints and dates are in POSIX format; fields the result
+        does not show are None. The records are kept like a snapshot until
+        the results change through click_sort_by, filter or the paginator,
+        or discard_snapshot is called.
+        """
+        if 'result_records' not in self._snapshot:
+            items = self.snapshot_items(self._listing_item_locator, self._listing_fields)
+            self._snapshot['result_records'] = tuple(search_result(**item) for item in items)
+        return self._snapshot['result_records']
+
     @property
     def paginator(self):
         from pages.desktop.regions.paginator import Paginator
-        return Paginator(self.testsetup)
+        return Paginator(self.testsetup, self)
 
     class SearchResultItem(Page):
         _name_locator = (By.CSS_SELECTOR, 'div.info > h3 > a')
@@ -143,3 +196,15 @@ class SearchResultList(Base):
                 return CompleteTheme(self.testsetup)
             else:
                 return Details(self.testsetup)
+
+    # what result_records and ListingCrawler read from each result
+    _listing_item_locator = _results_locator
+    _listing_fields = {
+        'name': (SearchResultItem._name_locator, 'text'),
+        'url': (SearchResultItem._name_locator, 'href'),
+        'text': (None, 'text'),
+        'date': (SearchResultItem._created_date, 'text'),
+        'sort_criteria': (SearchResultItem._sort_criteria, 'text'),
+        'class_name': (None, 'class'),
+    }
+    _listing_record = staticmethod(search_result)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from multiprocessing.pool import ThreadPool
+
+from pages.desktop.regions.paginator import Paginator, page_url
+
+
+class ListingCrawler(object):
+    """
+    Iterates over the pages of a listing, yielding a list of records per page.
+
+    The listing is a page object that declares _listing_item_locator and
+    _listing_fields, the (locator, what) of every field below an item,
+    where a locator of None reads the item itself. Items are turned into
+    records by the listing's _listing_record, or into dicts of the fields.
+
+    Pages are fetched over http and read from their html, so only what the
+    server sends is seen. While the records of one page are being checked
+    the next page is already being fetched in a background thread. The
+    crawl starts from the listing's current url, keeping its sort order,
+    and stops after the last page the paginator names, or max_pages.
+    """
+
+    def __init__(self, listing, url=None, start=1, max_pages=None):
+        self.listing = listing
+        self.url = url or listing.selenium.current_url
+        self.start = start
+        self.max_pages = max_pages
+
+    def __iter__(self):
+        pool = ThreadPool(1)
+        try:
+            number = self.start
+            pending = pool.apply_async(self.listing.static_document, (page_url(self.url, number),))
+            while pending is not None:
+                document = pending.get()
+                pending = None
+                if number < self._last_page_number(document):
+                    pending = pool.apply_async(self.listing.static_document,
+                                               (page_url(self.url, number + 1),))
+                yield self._records(document)
+                number += 1
+        finally:
+            pool.terminate()
+
+    def _last_page_number(self, document):
+        elements = document.find_elements(*self.listing._css_locator(*Paginator._total_page_number_locator))
+        last_page_number = elements and int(document.text(elements[0])) or self.start
+        if self.max_pages:
+            last_page_number = min(last_page_number, self.start + self.max_pages - 1)
+        return last_page_number
+
+    def _records(self, document):
+        records = []
+        for item in document.find_elements(*self.listing._css_locator(*self.listing._listing_item_locator)):
+            values = {}
+            for name, (locator, what) in self.listing._listing_fields.items():
+                if locator is None:
+                    values[name] = document.read(item, what)
+                    continue
+                using, value = self.listing._css_locator(*locator)
+                elements = document.find_elements(using, value, item)
+                values[name] = document.read(elements[0], what) if elements else None
+            record = getattr(self.listing, '_listing_record', None)
+            records.append(record(**values) if record else values)
+        return records
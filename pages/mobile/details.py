@@ -14,6 +14,7 @@ from pages.mobile.base import Base
 class Details(Base):
 
     _title_locator = (By.CSS_SELECTOR, 'div.infobox > h3')
+    _ready_locator = _title_locator
     _contribute_button_locator = (By.XPATH, "//a[contains(.,'Contribute')]")
 
     def __init__(self, testsetup, addon_name=None):
@@ -23,7 +24,7 @@ class Details(Base):
             self.addon_name = addon_name.replace(" ", "-")
             self.addon_name = re.sub(r'[^A-Za-z0-9\-]', '', self.addon_name).lower()
             self.addon_name = self.addon_name[:27]
-            self.selenium.get("%s/addon/%s" % (self.base_url, self.addon_name))
+            self.get_url("%s/addon/%s" % (self.base_url, self.addon_name))
 
     @property
     def _page_title(self):
@@ -22,6 +22,7 @@ class Home(Base):
     _learn_more_msg_locator = (By.CSS_SELECTOR, '#learnmore-msg')
     _tabs_locator = (By.CSS_SELECTOR, 'nav.tabs > ul > li')
     _search_box_locator = (By.CSS_SELECTOR, 'form#search > input')
+    _ready_locator = _search_box_locator
     _search_button_locator = (By.CSS_SELECTOR, 'form#search > button')
     _logo_title_locator = (By.CSS_SELECTOR, 'h1.site-title > a')
     _logo_image_locator = (By.CSS_SELECTOR, 'h1.site-title > a > img')
@@ -34,7 +35,7 @@ class Home(Base):
 
     def __init__(self, testsetup):
         Base.__init__(self, testsetup)
-        self.selenium.get(self.base_url)
+        self.get_url(self.base_url)
         self.is_the_current_page
 
     def search_for(self, search_term, click_button=True):
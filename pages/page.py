@@ -7,10 +7,241 @@
 Created on Jun 21, 2010
 
 '''
+import requests
 from unittestzero import Assert
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
 from selenium.common.exceptions import ElementNotVisibleException
+from selenium.webdriver.common.by import By
+
+
+# helpers the scripts below are built on: resolve finds the elements of a
+# locator like find_elements, read reads text, a property or an attribute
+# and isShown is close to what is_displayed checks, including the clipping
+# of overflow hidden ancestors
+_DOM_FUNCTIONS = """
+function resolve(using, value, root) {
+    root = root || document;
+    if (using === 'xpath') {
+        var result = document.evaluate(value, root, null,
+                                       XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    if (using === 'link text' || using === 'partial link text') {
+        return Array.prototype.filter.call(root.getElementsByTagName('a'), function(a) {
+            var text = (a.innerText || a.textContent).trim();
+            return using === 'link text' ? text === value : text.indexOf(value) !== -1;
+        });
+    }
+    return Array.prototype.slice.call(root.querySelectorAll(value));
+}
+
+function read(element, what) {
+    if (what === 'text') {
+        return (element.innerText || element.textContent || '').trim();
+    }
+    if (what === 'class') {
+        return element.className;
+    }
+    if (what in element && element[what] !== null && typeof element[what] !== 'object') {
+        return element[what];
+    }
+    return element.getAttribute(what);
+}
+
+function isShown(element) {
+    var rect = element.getBoundingClientRect();
+    if (!rect.width || !rect.height || getComputedStyle(element).visibility === 'hidden') {
+        return false;
+    }
+    for (var node = element; node && node.nodeType === 1; node = node.parentNode) {
+        var style = getComputedStyle(node);
+        if (style.display === 'none' || style.opacity === '0') {
+            return false;
+        }
+        if (node !== element && style.overflow !== 'visible') {
+            var box = node.getBoundingClientRect();
+            if (rect.right <= box.left || rect.left >= box.right ||
+                    rect.bottom <= box.top || rect.top >= box.bottom) {
+                return false;
+            }
+        }
+    }
+    return true;
+}
+"""
+
+_SNAPSHOT_SCRIPT = _DOM_FUNCTIONS + """
+var fields = arguments[0];
+var snapshot = {};
+
+for (var name in fields) {
+    var field = fields[name];
+    var elements = resolve(field[0], field[1]);
+    if (field[3]) {
+        snapshot[name] = elements.map(function(e) { return read(e, field[2]); });
+    } else {
+        snapshot[name] = elements.length ? read(elements[0], field[2]) : null;
+    }
+}
+return snapshot;
+"""
+
+_ITEMS_SCRIPT = _DOM_FUNCTIONS + """
+var fields = arguments[2];
+return resolve(arguments[0], arguments[1]).map(function(item) {
+    var values = {};
+    for (var name in fields) {
+        var field = fields[name];
+        var elements = field[0] ? resolve(field[0], field[1], item) : [item];
+        values[name] = elements.length ? read(elements[0], field[2]) : null;
+    }
+    return values;
+});
+"""
+
+_WAIT_FOR_CONDITION_SCRIPT = """
+var condition = new Function(arguments[0]);
+var args = arguments[1];
+var timeout = arguments[2];
+var callback = arguments[arguments.length - 1];
+var events = ['transitionend', 'animationend', 'load'];
+var done = false;
+var observer = null;
+
+function check() {
+    try {
+        return !!condition.apply(null, args);
+    } catch (e) {
+        return false;
+    }
+}
+
+function finish(result) {
+    if (done) {
+        return;
+    }
+    done = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    events.forEach(function(name) { document.removeEventListener(name, onEvent, true); });
+    clearTimeout(timer);
+    clearInterval(backstop);
+    callback(result);
+}
+
+function onEvent() {
+    if (check()) {
+        finish(true);
+    }
+}
+
+if (window.MutationObserver) {
+    observer = new MutationObserver(onEvent);
+    observer.observe(document.documentElement,
+                     {childList: true, subtree: true, attributes: true, characterData: true});
+}
+events.forEach(function(name) { document.addEventListener(name, onEvent, true); });
+// layout changes such as a box growing while its images load do not always
+// raise an event, so re-check now and then without leaving the browser
+var backstop = setInterval(onEvent, 100);
+var timer = setTimeout(function() { finish(check()); }, timeout);
+onEvent();
+"""
+
+# marks a page that later read only tests may reuse until its DOM changes
+_SHARE_PAGE_SCRIPT = """
+if (window.MutationObserver) {
+    window.__sharedPageUrl = arguments[0];
+    window.__sharedPageMutated = false;
+    new MutationObserver(function() { window.__sharedPageMutated = true; }).observe(
+        document.documentElement,
+        {childList: true, subtree: true, attributes: true, characterData: true});
+}
+"""
+
+# counts the XMLHttpRequest and fetch calls in flight on the root element,
+# so a change is a DOM mutation wait_for_condition wakes up on, and bumps
+# a generation on the results container whenever nodes are added to or
+# removed below it; the body stands in for a container the page lacks
+_TRACK_AJAX_SCRIPT = _DOM_FUNCTIONS + """
+var root = document.documentElement;
+if (!window.__ajaxTracked) {
+    window.__ajaxTracked = true;
+    var change = function(delta) {
+        root.setAttribute('data-ajax-in-flight', Number(root.getAttribute('data-ajax-in-flight') || 0) + delta);
+    };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        change(1);
+        this.addEventListener('loadend', function() { change(-1); });
+        try {
+            return send.apply(this, arguments);
+        } catch (e) {
+            change(-1);
+            throw e;
+        }
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function() {
+            change(1);
+            return fetch.apply(this, arguments).then(
+                function(response) { change(-1); return response; },
+                function(error) { change(-1); throw error; });
+        };
+    }
+}
+if (!window.MutationObserver) {
+    return null;
+}
+var container = resolve(arguments[0], arguments[1])[0] || document.body;
+if (container.__contentGeneration === undefined) {
+    container.__contentGeneration = 0;
+    new MutationObserver(function() { container.__contentGeneration++; }).observe(
+        container, {childList: true, subtree: true});
+}
+return container.__contentGeneration;
+"""
+
+# a container that was replaced has no generation yet and neither has one
+# in a document loaded since tracking started, so both count as changed
+_AJAX_IDLE_CONDITION = _DOM_FUNCTIONS + """
+var container = resolve(arguments[1], arguments[2])[0] || document.body;
+return Number(document.documentElement.getAttribute('data-ajax-in-flight') || 0) === 0 &&
+    (arguments[0] === null || container.__contentGeneration !== arguments[0]) &&
+    (!arguments[3] || resolve(arguments[3], arguments[4]).length === 0);
+"""
+
+_READY_CONDITION = _DOM_FUNCTIONS + """
+if (document.readyState === 'uninitialized') {
+    return false;
+}
+if (arguments[0]) {
+    return resolve(arguments[0], arguments[1]).length > 0;
+}
+return document.readyState !== 'loading';
+"""
+
+_IS_VISIBLE_SCRIPT = _DOM_FUNCTIONS + """
+var elements = resolve(arguments[0], arguments[1]);
+return elements.length > 0 && isShown(elements[0]);
+"""
+
+_RESTORE_SHARED_PAGE_SCRIPT = """
+if (window.__sharedPageUrl === arguments[0] && !window.__sharedPageMutated) {
+    window.scrollTo(0, 0);
+    return true;
+}
+return false;
+"""
 
 
 class Page(object):
@@ -18,6 +249,13 @@ class Page(object):
     Base class for all Pages.
     """
 
+    # the readiness probe: once it is present the page can be used, even
+    # when images, stylesheets or scripts are still loading
+    _ready_locator = None
+
+    # for the scripts of page objects, see _DOM_FUNCTIONS
+    _dom_functions = _DOM_FUNCTIONS
+
     def __init__(self, testsetup):
         """
         Constructor
@@ -27,22 +265,103 @@ class Page(object):
         self.api_base_url = testsetup.api_base_url
         self.selenium = testsetup.selenium
         self.timeout = testsetup.timeout
+        self._snapshot = {}
 
     def get_url(self, url):
+        if not getattr(self.testsetup, 'shared_pages', False):
+            self._load(url)
+        elif not self.selenium.execute_script(_RESTORE_SHARED_PAGE_SCRIPT, url):
+            self._load(url)
+            self.selenium.execute_script(_SHARE_PAGE_SCRIPT, url)
+
+    def _load(self, url):
         self.selenium.get(url)
+        if getattr(self.testsetup, 'page_load_strategy', 'normal') != 'normal':
+            self.wait_until_ready()
+
+    def wait_until_ready(self):
+        """
+        Waits for the readiness probe of the page.
+
+        With the eager page load strategy get returns before the page has
+        loaded, so navigation waits for _ready_locator to be
+        present instead. Pages without a probe wait for the document to be
+        parsed.
+        """
+        locator = self._ready_locator and self._css_locator(*self._ready_locator) or (None, None)
+        self.wait_for_condition(
+            _READY_CONDITION, locator,
+            'Timeout waiting for %s to be ready.' % type(self).__name__)
 
     @property
     def is_the_current_page(self):
-        WebDriverWait(self.selenium, self.timeout).until(
-            lambda s: s.title == self._page_title,
+        self.wait_for_condition(
+            'return document.title === arguments[0];', [self._page_title],
             "Expected page title: %s. Actual page title: %s" % (self._page_title, self.selenium.title))
         return True
 
+    def wait_for_condition(self, condition, args=(), message=''):
+        """
+        Waits until the javascript condition returns true.
+
+        The condition is the body of a function that receives args, like a
+        script given to execute_script. It is evaluated inside the browser
+        whenever the DOM mutates or a transition, animation or resource load
+        ends, so the wait ends as soon as the condition holds and costs a
+        single async script call. If the browser cannot run the script (or
+        the page is replaced while waiting) this falls back to polling.
+        """
+        try:
+            self._set_script_timeout(self.timeout + 5)
+            met = self.selenium.execute_async_script(
+                _WAIT_FOR_CONDITION_SCRIPT, condition, list(args), self.timeout * 1000)
+        except WebDriverException:
+            WebDriverWait(self.selenium, self.timeout).until(
+                lambda s: s.execute_script(condition, *args), message)
+        else:
+            if not met:
+                raise TimeoutException(message)
+
+    def _set_script_timeout(self, timeout):
+        # the session keeps its script timeout, so it is only sent when it changes
+        if getattr(self.selenium, '_script_timeout', None) != timeout:
+            self.selenium.set_script_timeout(timeout)
+            self.selenium._script_timeout = timeout
+
+    def track_ajax(self, container_locator):
+        """
+        Starts counting the requests the page sends and the changes to the
+        content below container_locator, such as the results of a listing.
+
+        Call it before the action that refreshes the container and hand
+        what it returns to wait_for_ajax_refresh afterwards.
+        """
+        return self.selenium.execute_script(_TRACK_AJAX_SCRIPT, *self._css_locator(*container_locator))
+
+    def wait_for_ajax_refresh(self, generation, container_locator, busy_locator=None):
+        """
+        Waits until the content below container_locator has changed since
+        track_ajax returned generation and no request is in flight, with a
+        single async script call. With busy_locator it also waits for that
+        element, such as a loading overlay, to be gone.
+        """
+        busy = busy_locator and self._css_locator(*busy_locator) or (None, None)
+        self.wait_for_condition(
+            _AJAX_IDLE_CONDITION, [generation] + list(self._css_locator(*container_locator)) + list(busy),
+            'Timeout waiting for %s to refresh.' % type(self).__name__)
+
     def get_url_current_page(self):
         WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
         return self.selenium.current_url
 
+    @property
+    def _has_implicit_wait(self):
+        # --zeroimplicitwait sets this to 0 for the whole session
+        return self.testsetup.default_implicit_wait != 0
+
     def is_element_present(self, *locator):
+        if not self._has_implicit_wait:
+            return len(self.selenium.find_elements(*locator)) > 0
         self.selenium.implicitly_wait(0)
         try:
             self.selenium.find_element(*locator)
@@ -54,6 +373,9 @@ class Page(object):
             self.selenium.implicitly_wait(self.testsetup.default_implicit_wait)
 
     def is_element_visible(self, *locator):
+        if not self._has_implicit_wait:
+            # finding the element and asking whether it is displayed in one round trip
+            return self.selenium.execute_script(_IS_VISIBLE_SCRIPT, *self._css_locator(*locator))
         try:
             return self.selenium.find_element(*locator).is_displayed()
         except (NoSuchElementException, ElementNotVisibleException):
@@ -61,3 +383,88 @@ class Page(object):
 
     def return_to_previous_page(self):
         self.selenium.back()
+
+    def snapshot(self, fields):
+        """
+        Reads many values from the page with a single WebDriver round trip.
+
+        fields maps a name to (locator, what) or (locator, what, True), where
+        what is 'text' or the name of an attribute and the trailing True
+        reads every element matched by the locator instead of the first one.
+        Missing elements read as None.
+
+        The result is returned and kept on the page, so properties that go
+        through _read return it instead of querying the browser again.
+        Call discard_snapshot once the DOM has changed.
+        """
+        script_fields = {}
+        for name, field in fields.items():
+            (by, value), what = field[:2]
+            script_fields[name] = self._css_locator(by, value) + (what, len(field) > 2 and field[2])
+        self._snapshot = self.selenium.execute_script(_SNAPSHOT_SCRIPT, script_fields)
+        return self._snapshot
+
+    def snapshot_items(self, item_locator, fields):
+        """
+        Reads the fields below every item with a single WebDriver round trip.
+
+        fields maps a name to (locator, what) like snapshot, where the
+        locator is looked up below the item and None reads the item itself.
+        Returns a dict of the fields for every item.
+        """
+        script_fields = {}
+        for name, (locator, what) in fields.items():
+            script_fields[name] = (locator and self._css_locator(*locator) or (None, None)) + (what,)
+        using, value = self._css_locator(*item_locator)
+        items = self.selenium.execute_script(_ITEMS_SCRIPT, using, value, script_fields)
+        return [dict((str(name), value) for name, value in item.items()) for item in items]
+
+    def static_snapshot(self, url, fields):
+        """
+        Reads the fields of snapshot from the html of url, without a browser.
+
+        Only what the server sends is read, nothing scripts add or change
+        afterwards. The result is kept on the page like a snapshot.
+        """
+        document = self.static_document(url)
+        self._snapshot = {}
+        for name, field in fields.items():
+            (by, value), what = field[:2]
+            elements = document.find_elements(*self._css_locator(by, value))
+            if len(field) > 2 and field[2]:
+                self._snapshot[name] = [document.read(element, what) for element in elements]
+            else:
+                self._snapshot[name] = document.read(elements[0], what) if elements else None
+        return self._snapshot
+
+    def static_document(self, url):
+        """Fetches url over http and parses its html into a StaticDocument."""
+        from pages.static_document import StaticDocument
+        http = getattr(self.testsetup, 'http_cache', requests)
+        response = http.get(url, headers={'Accept-Language': 'en-US'}, timeout=self.timeout)
+        response.raise_for_status()
+        return StaticDocument(response.content, response.url)
+
+    def discard_snapshot(self):
+        self._snapshot = {}
+
+    def _read(self, name, locator, what='text'):
+        """Returns the snapshot value for name, or reads it from the browser."""
+        if name in self._snapshot:
+            return self._snapshot[name]
+        element = self.selenium.find_element(*locator)
+        if what == 'text':
+            return element.text
+        return element.get_attribute(what)
+
+    def _css_locator(self, by, value):
+        """Maps a locator onto one the snapshot script can resolve."""
+        if by == By.ID:
+            return ('css selector', '[id="%s"]' % value)
+        elif by == By.CLASS_NAME:
+            return ('css selector', '.%s' % value)
+        elif by == By.NAME:
+            return ('css selector', '[name="%s"]' % value)
+        elif by == By.TAG_NAME:
+            return ('css selector', value)
+        return (by, value)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import re
+from urlparse import urljoin
+
+import lxml.html
+
+
+class StaticDocument(object):
+    """
+    The html of a page parsed without a browser, read with page locators.
+
+    Locators are resolved as the snapshot script resolves them: css
+    selectors, xpath and link text. Text is read the way innerText reads
+    it, with scripts and styles skipped, whitespace collapsed and block
+    elements on lines of their own. href and src read as absolute urls,
+    like the element properties a browser returns.
+    """
+
+    _block_tags = set([
+        'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+        'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hgroup',
+        'li', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul'])
+    _skipped_tags = set(['script', 'style', 'noscript', 'template'])
+
+    def __init__(self, html, url):
+        self.url = url
+        self.root = lxml.html.fromstring(html, base_url=url)
+
+    def find_elements(self, using, value, element=None):
+        """Finds the elements matching the locator below element, or in the whole document."""
+        root = self.root if element is None else element
+        if using == 'xpath':
+            return root.xpath(value)
+        if using in ('link text', 'partial link text'):
+            return [a for a in root.iter('a')
+                    if (self.text(a) == value if using == 'link text' else value in self.text(a))]
+        return root.cssselect(value)
+
+    def read(self, element, what):
+        if what == 'text':
+            return self.text(element)
+        value = element.get(what)
+        if what in ('href', 'src') and value is not None:
+            return urljoin(self.url, value)
+        return value
+
+    def text(self, element):
+        lines = ['']
+        self._collect_text(element, lines)
+        return '\n'.join(line.strip() for line in lines if line.strip())
+
+    def _collect_text(self, element, lines):
+        if not isinstance(element.tag, basestring) or element.tag in self._skipped_tags:
+            return
+        block = element.tag in self._block_tags
+        if block or element.tag == 'br':
+            lines.append('')
+        self._append(lines, element.text)
+        for child in element:
+            self._collect_text(child, lines)
+            self._append(lines, child.tail)
+        if block:
+            lines.append('')
+
+    def _append(self, lines, text):
+        if text:
+            lines[-1] = re.sub(r'\s+', ' ', lines[-1] + text)
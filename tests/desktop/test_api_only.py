@@ -13,6 +13,11 @@ from pages.desktop.addons_api import AddonsAPI
 #These tests should only call the api.
 #There should be no tests requiring selenium in this class.
 
+popular_addons = [
+    'Adblock Plus', 'Firebug', 'NoScript', 'Greasemonkey', 'DownThemAll!',
+    'Video DownloadHelper', 'Web Developer', 'FlashGot', 'ColorZilla', 'Xmarks',
+    'Tab Mix Plus', 'Download Statusbar', 'FireFTP', 'ScrapBook', 'Firesizer']
+
 
 @pytest.mark.skip_selenium
 class TestAPIOnlyTests:
@@ -42,3 +47,23 @@ class TestAPIOnlyTests:
     def test_that_firebug_has_install_link(self, mozwebqa):
         response = AddonsAPI(mozwebqa, 'Firebug')
         Assert.contains("fx.xpi?src=api", response.get_install_link())
+
+    @pytest.mark.nondestructive
+    def test_that_every_addon_found_for_fox_has_a_name_and_install_link(self, mozwebqa):
+        count = 0
+        for addon in AddonsAPI.iter_addons(mozwebqa, 'fox'):
+            Assert.true(addon.name)
+            Assert.contains("src=api", addon.install.lower())
+            count += 1
+        Assert.greater(count, 0)
+
+    @pytest.mark.nondestructive
+    def test_that_popular_addons_are_found_by_their_name(self, mozwebqa):
+        # search ranking changes, so only check that each lookup found an add-on with a name
+        failures = []
+        for name, response, error in AddonsAPI.bulk(mozwebqa, popular_addons, concurrency=8):
+            if error is not None:
+                failures.append('%s: %s' % (name, error))
+            elif not response.addon.name:
+                failures.append('%s: first result has no name' % name)
+        Assert.equal([], failures)
@@ -9,6 +9,7 @@ import pytest
 from unittestzero import Assert
 
 from pages.desktop.home import Home
+from utils.sort_order import assert_sorted_across_pages
 
 
 class TestCompleteThemes:
@@ -25,7 +26,7 @@ class TestCompleteThemes:
         addons_orig = addons
         addons.sort()
         [Assert.equal(addons_orig[i], addons[i]) for i in xrange(len(addons))]
-        complete_themes_page.paginator.click_next_page()
+        complete_themes_page.paginator.go_to_page(2)
         addons = complete_themes_page.addon_names
         addons_set = set(addons)
         Assert.equal(len(addons), len(addons_set), "There are duplicates in the names")
@@ -42,11 +43,9 @@ class TestCompleteThemes:
         addons = complete_themes_page.addon_names
         addons_set = set(addons)
         Assert.equal(len(addons), len(addons_set), "There are duplicates in the names")
-        updated_dates = complete_themes_page.addon_updated_dates
-        Assert.is_sorted_descending(updated_dates)
-        complete_themes_page.paginator.click_next_page()
-        updated_dates.extend(complete_themes_page.addon_updated_dates)
-        Assert.is_sorted_descending(updated_dates)
+        assert_sorted_across_pages(complete_themes_page.paginator,
+                                   lambda: complete_themes_page.addon_updated_dates,
+                                   descending=True, max_pages=2)
 
     @pytest.mark.native
     @pytest.mark.nondestructive
@@ -57,11 +56,9 @@ class TestCompleteThemes:
         addons = complete_themes_page.addon_names
         addons_set = set(addons)
         Assert.equal(len(addons), len(addons_set), "There are duplicates in the names")
-        created_dates = complete_themes_page.addon_created_dates
-        Assert.is_sorted_descending(created_dates)
-        complete_themes_page.paginator.click_next_page()
-        created_dates.extend(complete_themes_page.addon_created_dates)
-        Assert.is_sorted_descending(created_dates)
+        assert_sorted_across_pages(complete_themes_page.paginator,
+                                   lambda: complete_themes_page.addon_created_dates,
+                                   descending=True, max_pages=2)
 
     @pytest.mark.native
     @pytest.mark.nondestructive
@@ -72,11 +69,9 @@ class TestCompleteThemes:
         addons = complete_themes_page.addon_names
         addons_set = set(addons)
         Assert.equal(len(addons), len(addons_set), "There are duplicates in the names")
-        downloads = complete_themes_page.addon_download_number
-        Assert.is_sorted_descending(downloads)
-        complete_themes_page.paginator.click_next_page()
-        downloads.extend(complete_themes_page.addon_download_number)
-        Assert.is_sorted_descending(downloads)
+        assert_sorted_across_pages(complete_themes_page.paginator,
+                                   lambda: complete_themes_page.addon_download_number,
+                                   descending=True, max_pages=2)
 
     @pytest.mark.native
     @pytest.mark.nondestructive
@@ -164,7 +159,7 @@ class TestCompleteThemes:
     def test_that_last_complete_themes_page_is_not_empty(self, mozwebqa):
         home_page = Home(mozwebqa)
         complete_themes_page = home_page.header.click_complete_themes()
-        complete_themes_page.paginator.click_last_page()
+        complete_themes_page.paginator.go_to_last_page()
         Assert.greater_equal(complete_themes_page.addon_count, 1)
 
     @pytest.mark.action_chains
@@ -35,24 +35,44 @@ class TestDetails:
         details_page.header.hover_over_other_apps_menu()
         Assert.true(details_page.header.is_other_apps_dropdown_menu_visible)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_addon_name_is_displayed(self, mozwebqa):
         details_page = Details(mozwebqa, "Firebug")
         # check that the name is not empty
         Assert.not_none(details_page.title, "")
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_summary_is_displayed(self, mozwebqa):
         details_page = Details(mozwebqa, "Firebug")
         # check that the summary is not empty
         Assert.not_none(re.match('(\w+\s*){3,}', details_page.summary))
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_about_this_addon_is_displayed(self, mozwebqa):
         details_page = Details(mozwebqa, "Firebug")
         Assert.equal(details_page.about_addon, "About this Add-on")
         Assert.not_none(re.match('(\w+\s*){3,}', details_page.description))
 
+    @pytest.mark.nondestructive
+    def test_that_snapshot_matches_addon_information(self, mozwebqa):
+        details_page = Details(mozwebqa, "Firebug")
+        snapshot = details_page.snapshot()
+        Assert.equal(snapshot['about_addon'], "About this Add-on")
+        Assert.equal(snapshot['version_information_heading'], 'Version Information')
+        Assert.not_none(re.match('(\w+\s*){3,}', snapshot['summary']))
+        Assert.true(len(snapshot['authors']) > 0)
+
+        # properties answer from the snapshot until it is discarded
+        snapshot_title = details_page.title
+        details_page.discard_snapshot()
+        Assert.equal(snapshot_title, details_page.title)
+
     @pytest.mark.action_chains
     @pytest.mark.nondestructive
     def test_that_version_information_is_displayed(self, mozwebqa):
@@ -78,17 +98,20 @@ class TestDetails:
         for review in details_page.review_details:
             Assert.not_none(review)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_in_often_used_with_addons_are_displayed(self, mozwebqa):
         details_page = Details(mozwebqa, "Firebug")
         Assert.equal(details_page.often_used_with_header, u"Often used with\u2026")
         Assert.true(details_page.is_often_used_with_list_visible)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_tags_are_displayed(self, mozwebqa):
         details_page = Details(mozwebqa, "Firebug")
         Assert.true(details_page.are_tags_visible)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_part_of_collections_are_displayed(self, mozwebqa):
         details_page = Details(mozwebqa, "Firebug")
@@ -115,6 +138,7 @@ class TestDetails:
         Assert.not_none(re.match('(\w+\s*){3,}', user_faq_page.license_question))
         Assert.not_none(re.match('(\w+\s*){3,}', user_faq_page.license_answer))
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_other_addons_label_when_there_are_multiple_authors(self, mozwebqa):
         addon_with_multiple_authors = 'firebug'
@@ -123,6 +147,7 @@ class TestDetails:
         Assert.true(len(detail_page.authors) > 1)
         Assert.equal(detail_page.other_addons_by_authors_text, 'Other add-ons by these authors')
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_other_addons_label_when_there_is_only_one_author(self, mozwebqa):
         addon_with_one_authors = 'F1 by Mozilla Labs'
@@ -142,6 +167,7 @@ class TestDetails:
             Details(mozwebqa, 'firebug')
 
     @pytest.mark.nondestructive
+    @pytest.mark.load_resources('images')
     def test_open_close_functionality_for_image_viewer(self, mozwebqa):
 
         detail_page = Details(mozwebqa, 'firebug')
@@ -152,6 +178,7 @@ class TestDetails:
         Assert.false(image_viewer.is_visible)
 
     @pytest.mark.nondestructive
+    @pytest.mark.load_resources('images')
     def test_navigation_buttons_for_image_viewer(self, mozwebqa):
 
         detail_page = Details(mozwebqa, 'firebug')
@@ -218,6 +245,7 @@ class TestDetails:
             Assert.equal(username, amo_user_page.username)
             Details(mozwebqa, addon_name)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_details_page_has_breadcrumb(self, mozwebqa):
         detail_page = Details(mozwebqa, 'firebug')
@@ -325,7 +353,9 @@ class TestDetails:
         # Verify experimental version (beta or pre)
         Assert.not_none(re.match('Version\s\d+\.\d+\.\d+[a|b|rc]\d+\:', details_page.beta_version))
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_license_link_works(self, mozwebqa):
         addon_name = 'Firebug'
         details_page = Details(mozwebqa, addon_name)
@@ -18,17 +18,22 @@ class TestDetailsAgainstXML:
 
     firebug = "Firebug"
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_firebug_page_title_is_correct(self, mozwebqa):
         firebug_page = Details(mozwebqa, self.firebug)
         Assert.true(re.search(self.firebug, firebug_page.page_title) is not None)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_firebug_version_number_is_correct(self, mozwebqa):
         firebug_page = Details(mozwebqa, self.firebug)
         Assert.true(len(str(firebug_page.version_number)) > 0)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_firebug_authors_is_correct(self, mozwebqa):
 
         #get authors from browser
@@ -46,6 +51,7 @@ class TestDetailsAgainstXML:
         for i in range(len(xml_authors)):
             Assert.equal(xml_authors[i], browser_authors[i])
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_firebug_images_is_correct(self, mozwebqa):
 
@@ -69,7 +75,9 @@ class TestDetailsAgainstXML:
                 re.sub('src=api(&amp;|&)', '', xml_images[i]),
                 browser_images[i])
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_firebug_summary_is_correct(self, mozwebqa):
 
         #browser
@@ -82,11 +90,14 @@ class TestDetailsAgainstXML:
 
         Assert.equal(xml_summary, browser_summary)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_firebug_rating_is_correct(self, mozwebqa):
         firebug_page = Details(mozwebqa, self.firebug)
         Assert.equal("5", firebug_page.rating)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_description_text_is_correct(self, mozwebqa):
         #browser
@@ -101,6 +112,7 @@ class TestDetailsAgainstXML:
             browser_description.replace('\n', ''),
             xml_description.replace('\n', ''))
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_icon_is_correct(self, mozwebqa):
 
@@ -115,6 +127,7 @@ class TestDetailsAgainstXML:
 
         Assert.equal(browser_icon, xml_icon)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_support_url_is_correct(self, mozwebqa):
 
@@ -128,7 +141,9 @@ class TestDetailsAgainstXML:
 
         Assert.equal(browser_support_url, xml_support_url)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_rating_in_api_equals_rating_in_details_page(self, mozwebqa):
 
         #browser
@@ -210,6 +225,7 @@ class TestDetailsAgainstXML:
 
         Assert.equal(xml_devs_comments, browser_devs_comments)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
     def test_that_home_page_in_api_equals_home_page_in_details_page(self, mozwebqa):
 
@@ -223,7 +239,9 @@ class TestDetailsAgainstXML:
 
         Assert.contains(xml_home_page, browser_home_page)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_reviews_in_api_equals_reviews_in_details_page(self, mozwebqa):
 
         #browser
@@ -236,7 +254,9 @@ class TestDetailsAgainstXML:
 
         Assert.equal(browser_reviews, xml_reviews)
 
+    @pytest.mark.shared_page
     @pytest.mark.nondestructive
+    @pytest.mark.static_page
     def test_that_daily_users_in_api_equals_daily_users_in_details_page(self, mozwebqa):
 
         #browser
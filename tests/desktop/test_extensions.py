@@ -8,6 +8,7 @@ import pytest
 
 from unittestzero import Assert
 from pages.desktop.home import Home
+from utils.sort_order import assert_sorted_across_pages
 
 
 class TestExtensions:
@@ -65,6 +66,23 @@ class TestExtensions:
 
         Assert.true(featured_extensions_page.paginator.is_next_page_disabled, 'Next button is available')
 
+    @pytest.mark.nondestructive
+    def test_that_paginator_jumps_to_a_page_by_url(self, mozwebqa):
+        home_page = Home(mozwebqa)
+        featured_extensions_page = home_page.header.site_navigation_menu("Extensions").click()
+        paginator = featured_extensions_page.paginator
+        total_page_number = paginator.total_page_number
+
+        paginator.go_to_page(3)
+        Assert.equal(paginator.page_number, 3)
+        Assert.equal(paginator.start_item, 41)
+        Assert.contains('page=3', featured_extensions_page.get_url_current_page())
+
+        paginator.go_to_last_page()
+        Assert.equal(paginator.page_number, total_page_number)
+        Assert.true(paginator.is_next_page_disabled)
+        Assert.greater_equal(len(featured_extensions_page.extensions), 1)
+
     @pytest.mark.native
     @pytest.mark.nondestructive
     def test_that_checks_if_the_extensions_are_sorted_by_top_rated(self, mozwebqa):
@@ -94,12 +112,9 @@ class TestExtensions:
         Assert.equal(featured_extensions_page.sorter.sorted_by, "Newest")
         Assert.contains("sort=created", featured_extensions_page.get_url_current_page())
 
-        added_dates = [i.added_date for i in featured_extensions_page.extensions]
-        Assert.is_sorted_descending(added_dates)
-        featured_extensions_page.paginator.click_next_page()
-
-        added_dates.extend([i.added_date for i in featured_extensions_page.extensions])
-        Assert.is_sorted_descending(added_dates)
+        assert_sorted_across_pages(featured_extensions_page.paginator,
+                                   lambda: [i.added_date for i in featured_extensions_page.extensions],
+                                   descending=True, max_pages=2)
 
     @pytest.mark.native
     @pytest.mark.nondestructive
@@ -111,12 +126,9 @@ class TestExtensions:
         Assert.equal(featured_extensions_page.sorter.sorted_by, "Recently Updated")
         Assert.contains("sort=updated", featured_extensions_page.get_url_current_page())
 
-        updated_dates = [i.updated_date for i in featured_extensions_page.extensions]
-        Assert.is_sorted_descending(updated_dates)
-        featured_extensions_page.paginator.click_next_page()
-
-        updated_dates.extend([i.updated_date for i in featured_extensions_page.extensions])
-        Assert.is_sorted_descending(updated_dates)
+        assert_sorted_across_pages(featured_extensions_page.paginator,
+                                   lambda: [i.updated_date for i in featured_extensions_page.extensions],
+                                   descending=True, max_pages=2)
 
     @pytest.mark.native
     @pytest.mark.nondestructive
@@ -30,10 +30,10 @@ class TestInstalls:
 
         home_page = Home(mozwebqa)
         search_page = home_page.search_for("jetpack")
-        for result in search_page.results:
+        for i, result in enumerate(search_page.result_records):
             # click on the first compatible result
             if result.is_compatible:
-                details_page = result.click_result()
+                details_page = search_page.result(i).click_result()
                 break
 
         Assert.true(details_page.is_version_information_install_button_visible)
@@ -18,6 +18,8 @@ class TestPaypal:
     addon_name = 'Firebug'
 
     @pytest.mark.login
+    @pytest.mark.fresh_session
+    @pytest.mark.load_resources('thirdparty')
     def test_that_user_can_contribute_to_an_addon(self, mozwebqa):
         """Test that checks the Contribute button for an add-on using PayPal."""
 
@@ -41,6 +43,8 @@ class TestPaypal:
         Assert.true(addon_page.is_the_current_page)
 
     @pytest.mark.login
+    @pytest.mark.fresh_session
+    @pytest.mark.load_resources('thirdparty')
     def test_that_user_can_make_a_contribution_without_logging_into_amo(self, mozwebqa):
         """Test that checks if the user is able to make a contribution without logging in to AMO."""
         addon_page = Details(mozwebqa, self.addon_name)
@@ -59,6 +63,7 @@ class TestPaypal:
 
     @pytest.mark.smoke
     @pytest.mark.nondestructive
+    @pytest.mark.load_resources('thirdparty')
     def test_that_make_contribution_button_is_clickable_and_loads_paypal_frame_while_user_is_logged_out(self, mozwebqa):
         addon_page = Details(mozwebqa, self.addon_name)
         Assert.false(addon_page.header.is_user_logged_in)
@@ -74,6 +79,8 @@ class TestPaypal:
     @pytest.mark.smoke
     @pytest.mark.nondestructive
     @pytest.mark.login
+    @pytest.mark.fresh_session
+    @pytest.mark.load_resources('thirdparty')
     def test_that_make_contribution_button_is_clickable_and_loads_paypal_frame_while_user_is_logged_in(self, mozwebqa):
         addon_page = Details(mozwebqa, self.addon_name)
         addon_page.login()
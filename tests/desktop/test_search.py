@@ -10,6 +10,8 @@ import pytest
 from unittestzero import Assert
 
 from pages.desktop.home import Home
+from pages.desktop.regions.paginator import page_url
+from pages.listing_crawler import ListingCrawler
 
 
 class TestSearch:
@@ -83,6 +85,15 @@ class TestSearch:
         Assert.false(search_page.is_no_results_present)
         Assert.greater(search_page.result_count, 0)
 
+    @pytest.mark.skip_selenium
+    @pytest.mark.nondestructive
+    def test_that_page_urls_keep_the_search_terms(self, mozwebqa):
+        url = mozwebqa.base_url + u'/en-US/firefox/search/?q=caf%C3%A9&appver=&page=2'
+        Assert.equal(page_url(url, 3), mozwebqa.base_url + u'/en-US/firefox/search/?q=caf%C3%A9&appver=&page=3')
+
+        url = mozwebqa.base_url + u'/en-US/firefox/search/?q=\u0421\u043b\u043e\u0432\u0430\u0440\u0438'
+        Assert.equal(page_url(url, 2), url + u'&page=2')
+
     @pytest.mark.nondestructive
     def test_that_page_with_search_results_has_correct_title(self, mozwebqa):
         home_page = Home(mozwebqa)
@@ -97,7 +108,7 @@ class TestSearch:
     def test_that_searching_for_firebug_returns_firebug_as_first_result(self, mozwebqa):
         home_page = Home(mozwebqa)
         search_page = home_page.search_for('firebug')
-        results = [result.name for result in search_page.results]
+        results = [result.name for result in search_page.result_records]
 
         Assert.equal('Firebug', results[0])
 
@@ -108,12 +119,12 @@ class TestSearch:
         search_page = home_page.search_for(search_term)
         Assert.false(search_page.is_no_results_present)
 
-        for i in range(0, len(search_page.results)):
+        for i, result in enumerate(search_page.result_records):
             try:
-                Assert.contains(search_term, search_page.results[i].text.lower())
+                Assert.contains(search_term, result.text.lower())
             except:
                 devs_comments = ''
-                details_page = search_page.results[i].click_result()
+                details_page = search_page.result(i).click_result()
                 if details_page.is_devs_comments_section_present:
                     details_page.expand_devs_comments()
                     devs_comments = details_page.devs_comments_message
@@ -127,11 +138,13 @@ class TestSearch:
         search_page = Home(mozwebqa).search_for('firebug')
         search_page.click_sort_by('Weekly Downloads')
         Assert.true('sort=downloads' in search_page.get_url_current_page())
-        downloads = [i.downloads for i in search_page.results]
+        downloads = [i.downloads for i in search_page.result_records]
+        Assert.false(None in downloads, 'Some results show no download count: %s' % downloads)
         Assert.is_sorted_descending(downloads)
         search_page.paginator.click_next_page()
 
-        downloads.extend([i.downloads for i in search_page.results])
+        downloads.extend([i.downloads for i in search_page.result_records])
+        Assert.false(None in downloads, 'Some results show no download count: %s' % downloads)
         Assert.is_sorted_descending(downloads)
 
     @pytest.mark.native
@@ -140,7 +153,9 @@ class TestSearch:
         search_page = Home(mozwebqa).search_for('firebug')
         search_page.click_sort_by('Newest')
         Assert.true('sort=created' in search_page.get_url_current_page())
-        Assert.is_sorted_descending([i.created_date for i in search_page.results])
+        created_dates = [i.created_date for i in search_page.result_records]
+        Assert.false(None in created_dates, 'Some results show no added date: %s' % created_dates)
+        Assert.is_sorted_descending(created_dates)
 
     @pytest.mark.native
     @pytest.mark.nondestructive
@@ -148,10 +163,12 @@ class TestSearch:
         search_page = Home(mozwebqa).search_for('firebug')
         search_page.click_sort_by('Recently Updated')
         Assert.contains('sort=updated', search_page.get_url_current_page())
-        results = [i.updated_date for i in search_page.results]
+        results = [i.updated_date for i in search_page.result_records]
+        Assert.false(None in results, 'Some results show no updated date: %s' % results)
         Assert.is_sorted_descending(results)
         search_page.paginator.click_next_page()
-        results.extend([i.updated_date for i in search_page.results])
+        results.extend([i.updated_date for i in search_page.result_records])
+        Assert.false(None in results, 'Some results show no updated date: %s' % results)
         Assert.is_sorted_descending(results)
 
     @pytest.mark.native
@@ -160,7 +177,20 @@ class TestSearch:
         search_page = Home(mozwebqa).search_for('firebug')
         search_page.click_sort_by('Most Users')
         Assert.contains('sort=users', search_page.get_url_current_page())
-        Assert.is_sorted_descending([i.users for i in search_page.results])
+        users = [i.users for i in search_page.result_records]
+        Assert.false(None in users, 'Some results show no user count: %s' % users)
+        Assert.is_sorted_descending(users)
+
+    @pytest.mark.nondestructive
+    def test_that_crawled_search_results_stay_sorted_by_users(self, mozwebqa):
+        search_page = Home(mozwebqa).search_for('firebug')
+        search_page.click_sort_by('Most Users')
+        users = []
+        for results in ListingCrawler(search_page, max_pages=3):
+            Assert.greater(len(results), 0)
+            users.extend(result.users for result in results)
+        Assert.false(None in users, 'Some results show no user count: %s' % users)
+        Assert.is_sorted_descending(users)
 
     @pytest.mark.nondestructive
     def test_that_searching_for_a_tag_returns_results(self, mozwebqa):
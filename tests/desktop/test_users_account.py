@@ -17,6 +17,7 @@ class TestAccounts:
 
     @pytest.mark.nondestructive
     @pytest.mark.login
+    @pytest.mark.uncached_login
     @pytest.mark.native
     def test_user_can_login_and_logout_using_normal_login(self, mozwebqa):
 
@@ -30,6 +31,8 @@ class TestAccounts:
 
     @pytest.mark.nondestructive
     @pytest.mark.login
+    @pytest.mark.uncached_login
+    @pytest.mark.fresh_session
     def test_user_can_login_and_logout_using_browser_id(self, mozwebqa):
 
         home_page = Home(mozwebqa)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+A local stand-in for addons.mozilla.org that serves snapshotted pages.
+
+Take a snapshot of the pages the suite visits, then serve it and point the
+tests at the local server:
+
+    python -m utils.amo_server snapshot https://addons-dev.allizom.org amo.json
+    python -m utils.amo_server serve amo.json --port 8000
+    py.test --baseurl=http://localhost:8000 --apibaseurl=http://localhost:8000 ...
+"""
+
+import argparse
+import re
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from SocketServer import ThreadingMixIn
+from urlparse import urljoin, urlsplit
+
+import requests
+
+from utils.cassette import Cassette
+
+# home, details, search, themes, complete themes, collections, statistics,
+# discovery and the search api, with the short urls the page objects use
+snapshot_paths = [
+    '/',
+    '/en-US/firefox/',
+    '/addon/firebug',
+    '/en-US/firefox/addon/firebug/',
+    '/en-US/firefox/search/?q=firebug',
+    '/en-US/firefox/themes/',
+    '/en-US/firefox/complete-themes/',
+    '/en-US/firefox/collections/',
+    '/en-US/firefox/addon/firebug/statistics/',
+    '/en-US/firefox/discovery/pane/23.0/Darwin',
+    '/en-us/firefox/api/1.5/search/firebug',
+]
+
+# the discovery pane url carries the browser version and platform, any of them gets the snapshot
+_discovery_pane_pattern = re.compile(r'^(/[^/]+/firefox/discovery/pane)/[^/]+/[^/?]+')
+
+# stylesheets and scripts served by the site itself, so pages render as they do upstream
+_asset_pattern = re.compile(r'''(?:href|src)=["'](/[^"'?#]+\.(?:css|js)(?:\?[^"'#]*)?)["']''')
+
+
+def snapshot(base_url, path, paths=snapshot_paths):
+    """Records every page in paths, and the stylesheets and scripts they load, to a cassette."""
+    cassette = Cassette(path, record=True)
+    cassette.install()
+    session = requests.Session()
+    assets = set()
+    for page in paths:
+        response = session.get(base_url + page)
+        if 'html' in response.headers.get('content-type', ''):
+            assets.update(_asset_pattern.findall(response.text))
+    for asset in sorted(assets):
+        session.get(urljoin(base_url, asset))
+    cassette.save()
+
+
+class AMOServer(ThreadingMixIn, HTTPServer):
+    """
+    Serves the responses of a snapshot cassette by path and query.
+
+    Absolute links back to the snapshotted site, in bodies and redirects,
+    are rewritten to point at the local server; binary bodies such as
+    images are served as they were recorded. Anything that was not
+    snapshotted is a 404.
+    """
+
+    _text_types = ('text/', 'html', 'xml', 'javascript', 'json')
+
+    daemon_threads = True
+
+    def __init__(self, cassette_path, port=8000):
+        HTTPServer.__init__(self, ('127.0.0.1', port), _SnapshotHandler)
+        self.url = 'http://localhost:%s' % self.server_port
+        self.origins = set()
+        self.responses = {}
+        for interaction in Cassette(cassette_path).interactions:
+            url = urlsplit(interaction['url'])
+            self.origins.add('%s://%s' % (url.scheme, url.netloc))
+            key = url.path + (url.query and '?' + url.query)
+            # the last recording of a url wins
+            self.responses[(interaction['method'], key)] = interaction
+            self.responses[(interaction['method'], _discovery_pane_pattern.sub(r'\1', key))] = interaction
+        # bodies are utf-8 bytes, so compare them with bytes
+        self.origins = set(origin.encode('utf-8') for origin in self.origins)
+        self.url = str(self.url)
+
+    def localize(self, text):
+        for origin in self.origins:
+            text = text.replace(origin, self.url)
+        return text
+
+    def is_text(self, interaction):
+        content_type = ''
+        for name, value in interaction['headers'].items():
+            if name.lower() == 'content-type':
+                content_type = value.lower()
+        return 'body_base64' not in interaction and any(
+            text_type in content_type for text_type in self._text_types)
+
+
+class _SnapshotHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        interaction = self.server.responses.get(('GET', self.path)) or \
+            self.server.responses.get(('GET', _discovery_pane_pattern.sub(r'\1', self.path)))
+        if interaction is None:
+            self.send_error(404, 'No snapshot of %s' % self.path)
+            return
+
+        body = Cassette.body(interaction)
+        if self.server.is_text(interaction):
+            body = self.server.localize(body)
+        self.send_response(interaction['status'], interaction['reason'])
+        for name, value in interaction['headers'].items():
+            if name.lower() in ('location', 'content-location'):
+                value = self.server.localize(value.encode('utf-8')).decode('utf-8')
+            elif name.lower() in ('connection', 'keep-alive', 'set-cookie',
+                                  'strict-transport-security'):
+                continue
+            self.send_header(name, value.encode('utf-8'))
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for addons.mozilla.org.')
+    commands = parser.add_subparsers(dest='command')
+    snapshot_parser = commands.add_parser('snapshot', help='record the pages the suite visits')
+    snapshot_parser.add_argument('base_url')
+    snapshot_parser.add_argument('cassette')
+    snapshot_parser.add_argument('paths', nargs='*', default=snapshot_paths)
+    serve_parser = commands.add_parser('serve', help='serve a snapshot')
+    serve_parser.add_argument('cassette')
+    serve_parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    if args.command == 'snapshot':
+        snapshot(args.base_url.rstrip('/'), args.cassette, args.paths)
+    else:
+        server = AMOServer(args.cassette, args.port)
+        print 'Serving %s at %s' % (args.cassette, server.url)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+
+_NAVIGATING_COMMANDS = (Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD,
+                        Command.CLICK_ELEMENT, Command.CLICK, Command.SUBMIT_ELEMENT)
+
+_DISABLE_ANIMATIONS_SCRIPT = """
+if (!document.getElementById('disable-animations')) {
+    var style = document.createElement('style');
+    style.id = 'disable-animations';
+    style.textContent = '*, *:before, *:after {' +
+        ' transition: none !important;' +
+        ' animation-duration: 0s !important;' +
+        ' animation-delay: 0s !important; }';
+    (document.head || document.documentElement).appendChild(style);
+}
+if (window.jQuery) {
+    window.jQuery.fx.off = true;
+}
+"""
+
+
+def disable_animations(selenium):
+    """
+    Turns off CSS transitions, CSS animations and jQuery effects.
+
+    After every command that may load a document (navigating, clicking
+    or submitting) a stylesheet zeroing transitions and animations is
+    added to the current document and jQuery.fx is switched off, so
+    hovercards, flyouts, carousels and the image viewer jump straight to
+    their final state. A page a click navigates to may still be loading
+    when the script runs; it is covered from its first click on.
+    """
+    execute = selenium.execute
+
+    def still_execute(driver_command, params=None):
+        response = execute(driver_command, params)
+        if driver_command in _NAVIGATING_COMMANDS:
+            try:
+                execute(Command.EXECUTE_SCRIPT, {'script': _DISABLE_ANIMATIONS_SCRIPT, 'args': []})
+            except WebDriverException:
+                # an alert is open or the document is going away
+                pass
+        return response
+
+    selenium.execute = still_execute
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import base64
+import httplib
+import io
+import json
+import os
+from StringIO import StringIO
+from datetime import date, datetime
+from threading import Lock
+
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError
+from requests.packages.urllib3.response import HTTPResponse
+
+
+class Cassette(object):
+    """
+    Records the http exchanges made through requests, or plays them back.
+
+    When recording, every response is passed through and kept, to be
+    written out by save(). When replaying, the responses for each method
+    and url are served in the order they were recorded, the last one being
+    repeated, and a request that was never recorded fails with a
+    ConnectionError instead of reaching the network. today() is the day
+    the cassette was recorded, so urls built from the date replay too.
+    """
+
+    # the body is stored decoded, so these no longer describe it
+    _dropped_headers = ('content-encoding', 'content-length', 'transfer-encoding')
+
+    def __init__(self, path, record=False):
+        self.path = path
+        self.record = record
+        self._lock = Lock()
+        self.interactions = []
+        self._played = {}
+        if record:
+            self.recorded_on = date.today()
+        else:
+            with open(path) as f:
+                cassette = json.load(f)
+            self.recorded_on = datetime.strptime(cassette['recorded_on'], '%Y-%m-%d').date()
+            self.interactions = cassette['interactions']
+
+    def install(self):
+        cassette = self
+        send = HTTPAdapter.send
+
+        def recording_send(adapter, request, **kwargs):
+            response = send(adapter, request, **kwargs)
+            cassette._keep(request, response)
+            return response
+
+        def replaying_send(adapter, request, **kwargs):
+            return adapter.build_response(request, cassette._play(request))
+
+        HTTPAdapter.send = recording_send if self.record else replaying_send
+
+    def today(self):
+        return self.recorded_on
+
+    def save(self, path=None):
+        with open(path or self.path, 'w') as f:
+            json.dump({'recorded_on': str(self.recorded_on),
+                       'interactions': self.interactions}, f, separators=(',', ':'))
+
+    @classmethod
+    def merge(cls, path, paths):
+        """Writes the interactions of the cassettes at paths to one cassette, removing them."""
+        merged = cls(path, record=True)
+        for part in sorted(paths):
+            cassette = cls(part)
+            merged.recorded_on = min(merged.recorded_on, cassette.recorded_on)
+            merged.interactions.extend(cassette.interactions)
+        merged.save()
+        for part in paths:
+            os.remove(part)
+        return merged
+
+    @staticmethod
+    def body(interaction):
+        if 'body_base64' in interaction:
+            return base64.b64decode(interaction['body_base64'])
+        return interaction['body'].encode('utf-8')
+
+    def _keep(self, request, response):
+        interaction = {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': dict((name, value) for name, value in response.headers.items()
+                            if name.lower() not in self._dropped_headers)}
+        try:
+            interaction['body'] = response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            interaction['body_base64'] = base64.b64encode(response.content)
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def _play(self, request):
+        key = (request.method, request.url)
+        with self._lock:
+            recorded = [interaction for interaction in self.interactions
+                        if (interaction['method'], interaction['url']) == key]
+            if not recorded:
+                raise ConnectionError('No response to %s %s in cassette %s' % (
+                    request.method, request.url, self.path))
+            index = min(self._played.get(key, 0), len(recorded) - 1)
+            self._played[key] = index + 1
+        interaction = recorded[index]
+
+        return HTTPResponse(body=io.BytesIO(self.body(interaction)),
+                            headers=interaction['headers'],
+                            status=interaction['status'],
+                            reason=interaction['reason'],
+                            preload_content=False,
+                            decode_content=False,
+                            original_response=_RecordedMessage(interaction['headers']))
+
+
+class _RecordedMessage(object):
+    """stands in for the httplib response requests reads cookies from."""
+
+    def __init__(self, headers):
+        lines = ''.join('%s: %s\r\n' % header for header in headers.items())
+        self.msg = httplib.HTTPMessage(StringIO(lines.encode('utf-8') + '\r\n'))
+
+    def isclosed(self):
+        return True
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import sys
+from time import time
+
+from pages.page import Page
+
+
+class CommandRecorder(object):
+    """
+    Records every WebDriver command sent by a selenium session.
+
+    Each command is kept with the page object that sent it, the locator
+    for element lookups and how long the round trip took.
+    """
+
+    def __init__(self):
+        self.commands = []
+
+    def install(self, selenium):
+        execute = selenium.execute
+
+        def recording_execute(driver_command, params=None):
+            page_object = self._calling_page_object()
+            start = time()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.commands.append({
+                    'command': driver_command,
+                    'page_object': page_object,
+                    'locator': self._locator(params),
+                    'duration': time() - start})
+
+        selenium.execute = recording_execute
+
+    @property
+    def count(self):
+        return len(self.commands)
+
+    def summary(self):
+        """Returns the command count and time grouped by type, page object and locator."""
+        summary = {
+            'count': self.count,
+            'duration': sum(command['duration'] for command in self.commands),
+            'by_command': {},
+            'by_page_object': {},
+            'by_locator': {}}
+        for command in self.commands:
+            for group, key in (('by_command', command['command']),
+                               ('by_page_object', command['page_object']),
+                               ('by_locator', command['locator'])):
+                if key is None:
+                    continue
+                totals = summary[group].setdefault(key, {'count': 0, 'duration': 0})
+                totals['count'] += 1
+                totals['duration'] += command['duration']
+        return summary
+
+    def _calling_page_object(self):
+        frame = sys._getframe(2)
+        while frame is not None:
+            caller = frame.f_locals.get('self')
+            if isinstance(caller, Page):
+                return '%s.%s' % (type(caller).__module__, type(caller).__name__)
+            frame = frame.f_back
+        return None
+
+    def _locator(self, params):
+        if params and 'using' in params:
+            return '%s=%s' % (params['using'], params['value'])
+        return None
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from time import sleep, time
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+
+
+_WAITING_COMMANDS = (Command.FIND_ELEMENT, Command.FIND_CHILD_ELEMENT)
+
+
+def use_explicit_waits(selenium, timeout, poll_frequency=0.5):
+    """
+    Keeps the implicit wait of the session at 0.
+
+    Page objects written against an implicit wait expect find_element to
+    wait for the element to show up, so single element lookups (on the
+    driver and on web elements) are retried on the client side for up to
+    timeout seconds. find_elements returns straight away, which is what
+    makes presence checks a single round trip. Calls to implicitly_wait
+    are swallowed so nothing can switch the implicit wait back on.
+    """
+    selenium.implicitly_wait(0)
+    execute = selenium.execute
+
+    def explicit_wait_execute(driver_command, params=None):
+        if driver_command == Command.IMPLICIT_WAIT:
+            return {'status': 0, 'value': None}
+        if driver_command not in _WAITING_COMMANDS:
+            return execute(driver_command, params)
+
+        end_time = time() + timeout
+        while True:
+            try:
+                return execute(driver_command, params)
+            except NoSuchElementException:
+                if time() > end_time:
+                    raise
+                sleep(poll_frequency)
+
+    selenium.execute = explicit_wait_execute
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import json
+import os
+import shutil
+import tempfile
+
+# wide enough for the discovery pane, which hides elements below 1000 px
+WINDOW_SIZE = (1280, 1024)
+
+# prefs that keep Firefox from doing anything on startup a test never sees
+_LEAN_PREFERENCES = {
+    'app.update.auto': False,
+    'app.update.enabled': False,
+    'browser.cache.disk.enable': False,
+    'browser.safebrowsing.enabled': False,
+    'browser.safebrowsing.malware.enabled': False,
+    'browser.search.update': False,
+    'browser.sessionstore.resume_from_crash': False,
+    'browser.shell.checkDefaultBrowser': False,
+    'browser.startup.homepage_override.mstone': 'ignore',
+    'browser.startup.page': 0,
+    'browser.tabs.warnOnClose': False,
+    'datareporting.healthreport.service.enabled': False,
+    'datareporting.healthreport.uploadEnabled': False,
+    'datareporting.policy.dataSubmissionEnabled': False,
+    'extensions.blocklist.enabled': False,
+    'extensions.getAddons.cache.enabled': False,
+    'extensions.update.enabled': False,
+    'toolkit.startup.max_resumed_crashes': -1,
+    'toolkit.telemetry.enabled': False,
+}
+
+
+class HeadlessMode(object):
+    """
+    Runs the browser without a display, in a window of a fixed size.
+
+    Firefox is started with MOZ_HEADLESS and Chrome with --headless. Every
+    session gets a WINDOW_SIZE window, and maximize_window resizes it to
+    WINDOW_SIZE as there is no screen to fill. Unless a profile is given,
+    Firefox starts from a lean profile written once per worker, so
+    webdriver only copies a handful of prefs for each session.
+    """
+
+    def __init__(self, width=WINDOW_SIZE[0], height=WINDOW_SIZE[1]):
+        self.width = width
+        self.height = height
+        self._profile_path = None
+
+    def configure(self, options):
+        os.environ['MOZ_HEADLESS'] = '1'
+        os.environ['MOZ_HEADLESS_WIDTH'] = str(self.width)
+        os.environ['MOZ_HEADLESS_HEIGHT'] = str(self.height)
+
+        # xdist workers are handed the options the master already configured
+        chrome_options = json.loads(options.chrome_options or '{}')
+        arguments = chrome_options.setdefault('arguments', [])
+        if '--headless' not in arguments:
+            arguments.extend(
+                ['--headless', '--disable-gpu', '--window-size=%s,%s' % (self.width, self.height)])
+        options.chrome_options = json.dumps(chrome_options)
+
+        if not options.profile_path:
+            options.profile_path = self.lean_profile()
+
+    def lean_profile(self):
+        if self._profile_path is None:
+            self._profile_path = tempfile.mkdtemp(prefix='headless-profile-')
+            with open(os.path.join(self._profile_path, 'user.js'), 'w') as f:
+                for name, value in sorted(_LEAN_PREFERENCES.items()):
+                    f.write('user_pref(%s, %s);\n' % (json.dumps(name), json.dumps(value)))
+        return self._profile_path
+
+    def install(self, client_class):
+        mode = self
+        start = client_class.start
+
+        def headless_start(client):
+            start(client)
+            if client.webdriver and client.selenium:
+                mode.resize(client.selenium)
+
+        client_class.start = headless_start
+
+    def resize(self, selenium):
+        selenium.set_window_size(self.width, self.height)
+        selenium.maximize_window = lambda: selenium.set_window_size(self.width, self.height)
+
+    def close(self):
+        if self._profile_path:
+            shutil.rmtree(self._profile_path, ignore_errors=True)
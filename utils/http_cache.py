@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import errno
+import hashlib
+import json
+import os
+import tempfile
+
+import requests
+
+
+class HTTPCache(object):
+    """
+    Keeps GET responses on disk and revalidates them with the server.
+
+    Entries are keyed by url and hold the body with its ETag and
+    Last-Modified headers. A cached url is requested with If-None-Match
+    and If-Modified-Since and a 304 is answered with the body from disk.
+    Entries are written to a temporary file and renamed into place, so
+    xdist workers can share one directory, and the least recently used
+    entries are removed once the directory grows past max_size bytes.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def get(self, url, session=requests, **kwargs):
+        """Works like requests.get, returning a 200 response with the cached body on a 304."""
+        path = self._path(url)
+        entry = self._load(path)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and entry:
+            response.status_code = 200
+            response.reason = 'OK'
+            response._content = entry['body']
+            response._content_consumed = True
+            self._touch(path)
+        elif response.status_code == 200 and (response.headers.get('etag') or
+                                              response.headers.get('last-modified')):
+            self._store(path, url, response)
+            self._evict()
+        return response
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url).hexdigest())
+
+    def _load(self, path):
+        try:
+            with open(path, 'rb') as f:
+                entry = json.loads(f.readline())
+                entry['body'] = f.read()
+            return entry
+        except (IOError, ValueError):
+            return None
+
+    def _store(self, path, url, response):
+        metadata = {
+            'url': url,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified')}
+        # written aside and renamed so other workers never read half an entry
+        fd, temp_path = tempfile.mkstemp(prefix='.', dir=self.directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json.dumps(metadata) + '\n')
+            f.write(response.content)
+        os.rename(temp_path, path)
+
+    def _touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith('.'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        size = sum(entry[1] for entry in entries)
+        for mtime, entry_size, name in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            size -= entry_size
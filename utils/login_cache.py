@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from time import time
+
+
+class LoginCache(object):
+    """
+    Remembers the session cookies of every user that has logged in.
+
+    Restoring a user copies their cookies into the browser, which has to
+    be on the site already, and reloads the page. Cookies past their
+    expiry are never restored and logging out forgets the session.
+    """
+
+    _cookie_keys = ('name', 'value', 'path', 'secure', 'expiry')
+
+    def __init__(self):
+        self._cookies = {}
+
+    def store(self, user, cookies):
+        self._cookies[user] = [dict((key, cookie[key]) for key in self._cookie_keys if key in cookie)
+                               for cookie in cookies]
+
+    def restore(self, selenium, user):
+        cookies = self._cookies.get(user)
+        if not cookies:
+            return False
+        if any(cookie.get('expiry', time() + 1) <= time() for cookie in cookies):
+            self.invalidate(user)
+            return False
+        for cookie in cookies:
+            selenium.add_cookie(cookie)
+        selenium.refresh()
+        return True
+
+    def invalidate(self, user):
+        self._cookies.pop(user, None)
+
+    def invalidate_session(self, cookies):
+        """Forgets every user that shares a cookie with the given session."""
+        session = set((cookie['name'], cookie['value']) for cookie in cookies)
+        for user, user_cookies in self._cookies.items():
+            if session.intersection((cookie['name'], cookie['value']) for cookie in user_cookies):
+                self.invalidate(user)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+PAGE_LOAD_STRATEGIES = ('normal', 'eager')
+
+
+def use_page_load_strategy(strategy):
+    """
+    Asks every new webdriver session for the given page load strategy.
+
+    With eager, navigation returns once the document has been parsed, so
+    Page.get_url waits for the readiness probe of the page instead of
+    every image and script. There is no none: clicks and submits that
+    navigate would return before the next document has even started.
+    """
+    start_session = WebDriver.start_session
+
+    def start_session_with_strategy(driver, desired_capabilities, *args, **kwargs):
+        desired_capabilities = dict(desired_capabilities, pageLoadStrategy=strategy)
+        return start_session(driver, desired_capabilities, *args, **kwargs)
+
+    WebDriver.start_session = start_session_with_strategy
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import base64
+import json
+import urllib
+import urlparse
+
+RESOURCE_KINDS = ('images', 'fonts', 'thirdparty')
+
+# the site signs users in through persona and serves its media from a cdn
+_FIRST_PARTY_DOMAINS = ('mozilla.org', 'mozilla.net', 'allizom.org', 'persona.org')
+
+_FIREFOX_PREFERENCES = {
+    'images': {'permissions.default.image': 2},
+    'fonts': {'browser.display.use_document_fonts': 0,
+              'gfx.downloadable_fonts.enabled': False},
+}
+
+# requests to other hosts go to the discard port, so they fail straight away
+_PAC_SCRIPT = """
+function FindProxyForURL(url, host) {
+    var domains = %s;
+    for (var i = 0; i < domains.length; i++) {
+        if (host === domains[i] || dnsDomainIs(host, '.' + domains[i])) {
+            return 'DIRECT';
+        }
+    }
+    return 'PROXY 127.0.0.1:9';
+}
+"""
+
+
+class ResourcePolicy(object):
+    """
+    Decides which resources the browser of each test does not load.
+
+    Images and web fonts are turned off through browser prefs, and hosts
+    other than the ones under test are sent to a dead proxy by a proxy
+    auto-config script. The kinds given on the command line are blocked
+    for every test; block_resources replaces them for one test and
+    load_resources lets it load some of them again. Chrome has no switch
+    for web fonts, so it only blocks images and third party hosts.
+    """
+
+    def __init__(self, options, blocked=()):
+        self.blocked = frozenset(blocked)
+        self.domains = list(_FIRST_PARTY_DOMAINS)
+        for url in (options.base_url, options.api_base_url):
+            host = url and urlparse.urlparse(url).hostname
+            if host and host not in self.domains:
+                self.domains.append(host)
+        self._firefox_preferences = options.firefox_preferences
+        self._chrome_options = options.chrome_options
+
+    def blocked_for(self, keywords):
+        blocked = self.blocked
+        if 'block_resources' in keywords:
+            blocked = frozenset(keywords['block_resources'].args)
+        if 'load_resources' in keywords:
+            blocked = blocked.difference(keywords['load_resources'].args)
+        return blocked
+
+    def apply(self, options, blocked):
+        """Sets the browser options pytest-mozwebqa starts the next browser with."""
+        options.firefox_preferences = self._firefox_preferences
+        options.chrome_options = self._chrome_options
+        if not blocked:
+            return
+
+        preferences = json.loads(self._firefox_preferences or '{}')
+        chrome_options = json.loads(self._chrome_options or '{}')
+        arguments = chrome_options.setdefault('arguments', [])
+        for kind in blocked:
+            preferences.update(_FIREFOX_PREFERENCES.get(kind, {}))
+        if 'images' in blocked:
+            arguments.append('--blink-settings=imagesEnabled=false')
+        if 'thirdparty' in blocked:
+            pac_script = _PAC_SCRIPT % json.dumps(self.domains)
+            preferences['network.proxy.type'] = 2
+            preferences['network.proxy.autoconfig_url'] = 'data:text/plain,' + urllib.quote(pac_script)
+            arguments.append('--proxy-pac-url=data:application/x-javascript-config;base64,' +
+                             base64.b64encode(pac_script))
+        options.firefox_preferences = json.dumps(preferences)
+        options.chrome_options = json.dumps(chrome_options)
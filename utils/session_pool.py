@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from selenium.common.exceptions import WebDriverException
+
+
+class SessionPool(object):
+    """
+    Keeps webdriver sessions alive between tests.
+
+    Once installed on the pytest-mozwebqa selenium client, starting a
+    client checks out an idle session instead of launching a browser, and
+    stopping it resets the session and checks it back in. A reset closes
+    every window but one, clears the cookies and storage of the
+    application under test and loads about:blank. Sessions that cannot be
+    reset are quit. Only the cookies of the application under test are
+    cleared, so tests that sign in to other sites, such as Persona or
+    PayPal, are marked fresh_session. Set fresh to give the next test a
+    browser of its own, or keep_page to check the session in without leaving the page, so the
+    next read only test can pick it up where the last one left it. Only
+    sessions started with the same key, such as the resources the browser
+    was told to block, are handed to the same test.
+    """
+
+    def __init__(self):
+        self.fresh = False
+        self.keep_page = False
+        self.key = None
+        self._idle = {}
+
+    def install(self, client_class):
+        pool = self
+        start = client_class.start
+        stop = client_class.stop
+
+        def pooled_start(client):
+            client.pool_key = pool.key
+            idle = pool._idle.get(pool.key)
+            if pool.fresh or not client.webdriver or not idle:
+                return start(client)
+            client.selenium = idle.pop()
+
+        def pooled_stop(client):
+            if pool.fresh or not client.webdriver:
+                return stop(client)
+            if pool._reset(client):
+                pool._idle.setdefault(client.pool_key, []).append(client.selenium)
+            else:
+                stop(client)
+
+        client_class.start = pooled_start
+        client_class.stop = pooled_stop
+
+    def close(self):
+        for idle in self._idle.values():
+            while idle:
+                try:
+                    idle.pop().quit()
+                except WebDriverException:
+                    pass
+
+    def _reset(self, client):
+        selenium = client.selenium
+        # drop whatever the last test wrapped around the session
+        selenium.__dict__.pop('execute', None)
+        try:
+            handles = selenium.window_handles
+            for handle in handles[1:]:
+                selenium.switch_to_window(handle)
+                selenium.close()
+            selenium.switch_to_window(handles[0])
+
+            if self.keep_page:
+                selenium.implicitly_wait(client.default_implicit_wait)
+                return True
+
+            # cookies and storage can only be cleared from their own origin
+            if not selenium.current_url.startswith(client.base_url):
+                selenium.get(client.base_url + '/robots.txt')
+            selenium.delete_all_cookies()
+            selenium.execute_script(
+                'try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}')
+
+            selenium.get('about:blank')
+            selenium.implicitly_wait(client.default_implicit_wait)
+            return True
+        except WebDriverException:
+            return False
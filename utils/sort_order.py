@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from itertools import islice
+
+
+def assert_sorted_across_pages(paginator, read_values, descending=False, key=None, max_pages=None):
+    """
+    Checks that a listing is sorted from the current page to its last one.
+
+    Pages are loaded one after the other through paginator.pages() and
+    read_values is called on each to read the values the listing is sorted
+    by. Only the last value of the previous page is kept, so memory does
+    not grow with the listing. The check stops loading pages at the first
+    value out of order and fails with its page and position. Give
+    max_pages to look at part of a long listing only.
+
+    Returns the number of values checked.
+    """
+    previous = None
+    checked = 0
+    for page_number in islice(paginator.pages(), max_pages):
+        for position, value in enumerate(read_values(), 1):
+            sort_value = key(value) if key else value
+            if previous is not None:
+                previous_sort_value, previous_value, previous_page, previous_position = previous
+                if (sort_value > previous_sort_value) if descending else (sort_value < previous_sort_value):
+                    raise AssertionError(
+                        'Listing is not sorted %s: %r on page %s, position %s comes after %r '
+                        'on page %s, position %s' % (
+                            'descending' if descending else 'ascending', value, page_number, position,
+                            previous_value, previous_page, previous_position))
+            previous = (sort_value, value, page_number, position)
+            checked += 1
+    return checked
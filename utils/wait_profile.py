@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import csv
+import json
+import sys
+from time import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.page import Page
+
+
+class WaitProfiler(object):
+    """
+    Times every WebDriverWait.until and Page.wait_for_condition call.
+
+    Each wait is recorded with the class and method that started it, the
+    test it ran in, how long it took, how many times the condition was
+    checked and whether it timed out. A wait started inside another wait
+    (wait_for_condition falling back to polling) counts towards the outer
+    one.
+    """
+
+    _fields = ['elapsed', 'polls', 'timed_out', 'page_object', 'method', 'test']
+
+    def __init__(self):
+        self.waits = []
+        self.test = None
+        self._active = None
+
+    def install(self):
+        profiler = self
+        until = WebDriverWait.until
+        wait_for_condition = Page.wait_for_condition
+
+        def profiled_until(wait, method, message=''):
+            def counted_method(driver):
+                profiler._active['polls'] += 1
+                return method(driver)
+            return profiler._profile(lambda: until(wait, counted_method, message))
+
+        def profiled_wait_for_condition(page, condition, args=(), message=''):
+            return profiler._profile(lambda: wait_for_condition(page, condition, args, message), polls=1)
+
+        WebDriverWait.until = profiled_until
+        Page.wait_for_condition = profiled_wait_for_condition
+
+    def write(self, path):
+        """Writes the waits, longest first, as csv or json depending on the file extension."""
+        waits = sorted(self.waits, key=lambda wait: wait['elapsed'], reverse=True)
+        with open(path, 'wb' if path.endswith('.csv') else 'w') as f:
+            if path.endswith('.csv'):
+                writer = csv.DictWriter(f, self._fields)
+                writer.writeheader()
+                writer.writerows(waits)
+            else:
+                json.dump(waits, f, indent=2)
+
+    def _profile(self, wait, polls=0):
+        if self._active is not None:
+            return wait()
+
+        page_object, method = self._caller()
+        self._active = {
+            'page_object': page_object,
+            'method': method,
+            'test': self.test,
+            'polls': polls,
+            'timed_out': False}
+        start = time()
+        try:
+            return wait()
+        except TimeoutException:
+            self._active['timed_out'] = True
+            raise
+        finally:
+            self._active['elapsed'] = time() - start
+            self.waits.append(self._active)
+            self._active = None
+
+    def _caller(self):
+        # the generic waits of pages.page are credited to the page object method using them
+        frame = sys._getframe(1)
+        while frame.f_globals.get('__name__') in (__name__, Page.__module__):
+            frame = frame.f_back
+        caller = frame.f_locals.get('self')
+        if caller is None:
+            return frame.f_globals.get('__name__'), frame.f_code.co_name
+        return '%s.%s' % (type(caller).__module__, type(caller).__name__), frame.f_code.co_name